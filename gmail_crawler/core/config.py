@@ -2,10 +2,11 @@
 설정 관리 모듈
 환경변수와 기본값을 통합 관리합니다.
 """
+import functools
 import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Set
 
 try:
     from dotenv import load_dotenv
@@ -15,7 +16,11 @@ except ImportError:
     pass
 
 
-@dataclass
+# 현재 프로세스에서 이미 생성을 확인한 디렉토리
+_ensured_dirs: Set[Path] = set()
+
+
+@dataclass(frozen=True, slots=True, eq=False)
 class Config:
     """애플리케이션 설정을 관리하는 클래스"""
     
@@ -27,6 +32,10 @@ class Config:
     
     # API 설정
     gemini_api_key: Optional[str] = None
+    gemini_cache: bool = True  # 동일한 이미지의 Gemini 응답을 temp_dir에 캐시
+    gemini_max_image_width: int = 1500  # 전송 전 이미지 최대 너비 (0이면 축소하지 않음)
+    message_cache: bool = True  # Gmail 메시지 응답을 temp_dir의 SQLite 파일에 캐시
+    message_cache_ttl: int = 0  # 메시지 캐시 유효 시간(초) (0이면 만료되지 않음)
     
     # 출력 설정
     output_dir: Path = Path("output")
@@ -39,30 +48,69 @@ class Config:
     # HTML 캡처 설정
     device_scale_factor: int = 2
     full_page_capture: bool = True
+    save_html: bool = False  # 캡처한 HTML을 디버깅용으로 output_dir에 저장
     
     @classmethod
+    @functools.lru_cache(maxsize=1)
     def from_env(cls) -> "Config":
-        """환경변수에서 설정을 로드합니다."""
+        """
+        환경변수에서 설정을 로드합니다.
+        
+        최초 호출 결과를 캐시하여 이후 호출에서는 환경변수를 다시 읽지 않습니다.
+        환경변수 변경을 반영하려면 invalidate_cache()를 호출하세요.
+        """
+        return cls._build_from_env()
+    
+    @classmethod
+    def _build_from_env(cls) -> "Config":
+        """환경변수를 읽어 새 설정 객체를 생성합니다."""
+        env = os.environ
+        log_file = env.get("LOG_FILE")
         return cls(
-            sender_name=os.environ.get("SENDER_NAME", "이도한"),
-            message_id=os.environ.get("MESSAGE_ID"),
-            target_date=os.environ.get("TARGET_DATE"),
-            max_results=int(os.environ.get("MAX_RESULTS", "10")),
-            gemini_api_key=os.environ.get("GEMINI_API_KEY"),
-            output_dir=Path(os.environ.get("OUTPUT_DIR", "output")),
-            temp_dir=Path(os.environ.get("TEMP_DIR", "temp")),
-            log_level=os.environ.get("LOG_LEVEL", "INFO"),
-            log_file=Path(os.environ.get("LOG_FILE")) if os.environ.get("LOG_FILE") else None,
-            device_scale_factor=int(os.environ.get("DEVICE_SCALE_FACTOR", "2")),
-            full_page_capture=os.environ.get("FULL_PAGE_CAPTURE", "true").lower() == "true",
+            sender_name=env.get("SENDER_NAME", "이도한"),
+            message_id=env.get("MESSAGE_ID"),
+            target_date=env.get("TARGET_DATE"),
+            max_results=int(env.get("MAX_RESULTS", "10")),
+            gemini_api_key=env.get("GEMINI_API_KEY"),
+            gemini_cache=env.get("GEMINI_CACHE", "true").lower() == "true",
+            gemini_max_image_width=int(env.get("GEMINI_MAX_IMAGE_WIDTH", "1500")),
+            message_cache=env.get("MESSAGE_CACHE", "true").lower() == "true",
+            message_cache_ttl=int(env.get("MESSAGE_CACHE_TTL", "0")),
+            output_dir=Path(env.get("OUTPUT_DIR", "output")),
+            temp_dir=Path(env.get("TEMP_DIR", "temp")),
+            log_level=env.get("LOG_LEVEL", "INFO"),
+            log_file=Path(log_file) if log_file else None,
+            device_scale_factor=int(env.get("DEVICE_SCALE_FACTOR", "2")),
+            full_page_capture=env.get("FULL_PAGE_CAPTURE", "true").lower() == "true",
+            save_html=env.get("SAVE_HTML", "false").lower() == "true",
         )
     
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """from_env()의 캐시를 비웁니다."""
+        cls.from_env.cache_clear()
+    
+    @property
+    def gemini_cache_dir(self) -> Optional[Path]:
+        """Gemini 응답 캐시 디렉토리 (캐시를 사용하지 않으면 None)"""
+        return self.temp_dir / "gemini_cache" if self.gemini_cache else None
+    
+    @property
+    def message_cache_file(self) -> Optional[Path]:
+        """Gmail 메시지 캐시 파일 (캐시를 사용하지 않으면 None)"""
+        return self.temp_dir / "msg_cache.sqlite" if self.message_cache else None
+    
     def ensure_directories(self) -> None:
-        """필요한 디렉토리들을 생성합니다."""
-        self.output_dir.mkdir(exist_ok=True)
-        self.temp_dir.mkdir(exist_ok=True)
+        """필요한 디렉토리들을 생성합니다. 이미 생성한 디렉토리는 건너뜁니다."""
+        directories = [self.output_dir, self.temp_dir]
         if self.log_file:
-            self.log_file.parent.mkdir(parents=True, exist_ok=True)
+            directories.append(self.log_file.parent)
+        
+        for directory in directories:
+            if directory in _ensured_dirs:
+                continue
+            directory.mkdir(parents=True, exist_ok=True)
+            _ensured_dirs.add(directory)
     
     def validate(self) -> None:
         """설정값의 유효성을 검증합니다."""
@@ -3,20 +3,20 @@
 Gmail 이메일에서 테이블을 추출하여 Excel로 변환하는 전체 프로세스를 관리합니다.
 """
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import replace
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 from googleapiclient.discovery import build
 
 from .config import Config
-from ..utils.exceptions import GmailCrawlerError
+from ..utils.exceptions import EmailNotFoundError, GmailCrawlerError, ValidationError
 from ..utils.logger import LoggerMixin
 from ..models.models import EmailData, ProcessingResult, FilePaths
 from ..services.gmail_auth import GmailAuthenticator
+from ..services.message_cache import MessageCache
 from ..services.read_body import EmailExtractor
-from ..services.html_to_image import capture_html_to_png
-from ..services.geminiApi import GeminiAPIClient
-from ..services.json_to_excel import json_tables_to_excel
 from ..utils.utils import (
     save_html_file, 
     create_table_html, 
@@ -24,11 +24,16 @@ from ..utils.utils import (
     save_json_file,
     generate_timestamp,
     clean_filename,
-    parse_date_from_subject,
+    build_date_query,
+    build_date_index,
     find_message_by_date,
     find_latest_message
 )
 
+if TYPE_CHECKING:
+    # playwright, google.genai, xlsxwriter 등 무거운 의존성은 실제 사용 시점에 import합니다.
+    from ..services.geminiApi import GeminiAPIClient
+
 
 class GmailTableExtractor(LoggerMixin):
     """Gmail 이메일에서 테이블을 추출하는 메인 클래스"""
@@ -37,7 +42,8 @@ class GmailTableExtractor(LoggerMixin):
         self.config = config
         self.gmail_service: Optional[build] = None
         self.email_extractor: Optional[EmailExtractor] = None
-        self.gemini_client: Optional[GeminiAPIClient] = None
+        self.message_cache: Optional[MessageCache] = None
+        self.gemini_client: Optional["GeminiAPIClient"] = None
         
         # 디렉토리 생성
         self.config.ensure_directories()
@@ -48,17 +54,44 @@ class GmailTableExtractor(LoggerMixin):
             self.logger.info("Gmail 인증 시작")
             authenticator = GmailAuthenticator()
             self.gmail_service = authenticator.authenticate()
-            self.email_extractor = EmailExtractor(self.gmail_service)
+            if self.message_cache is None:
+                self.message_cache = self._open_message_cache()
+            self.email_extractor = EmailExtractor(self.gmail_service, cache=self.message_cache)
             self.logger.info("Gmail 인증 완료")
         except Exception as e:
             self.logger.error(f"Gmail 인증 실패: {e}")
             raise
     
+    def _open_message_cache(self) -> Optional[MessageCache]:
+        """설정에 따라 메시지 캐시를 엽니다. 열 수 없으면 캐시 없이 진행합니다."""
+        cache_file = self.config.message_cache_file
+        if cache_file is None:
+            return None
+        try:
+            return MessageCache(cache_file, ttl=self.config.message_cache_ttl)
+        except Exception as e:
+            self.logger.warning(f"메시지 캐시를 열 수 없어 캐시 없이 진행합니다: {e}")
+            return None
+    
+    def close(self) -> None:
+        """열려 있는 메시지 캐시를 닫습니다."""
+        if self.message_cache is not None:
+            self.message_cache.close()
+            self.message_cache = None
+            if self.email_extractor is not None:
+                self.email_extractor.cache = None
+    
     def initialize_gemini(self) -> None:
         """Gemini API 클라이언트를 초기화합니다."""
+        from ..services.geminiApi import GeminiAPIClient
+        
         try:
             self.logger.info("Gemini API 초기화 시작")
-            self.gemini_client = GeminiAPIClient(self.config.gemini_api_key)
+            self.gemini_client = GeminiAPIClient(
+                self.config.gemini_api_key, 
+                cache_dir=self.config.gemini_cache_dir,
+                max_image_width=self.config.gemini_max_image_width,
+            )
             self.logger.info("Gemini API 초기화 완료")
         except Exception as e:
             self.logger.error(f"Gemini API 초기화 실패: {e}")
@@ -83,38 +116,26 @@ class GmailTableExtractor(LoggerMixin):
                 self.logger.info(f"특정 메시지 추출: {self.config.message_id}")
                 return self.email_extractor.get_email_data(self.config.message_id)
             else:
-                # 발신자로부터 메시지 목록 추출
-                self.logger.info(f"발신자로부터 메시지 목록 추출: {self.config.sender_name}")
-                messages_data = self.email_extractor.list_messages_from_sender(
-                    self.config.sender_name, 
-                    self.config.max_results
-                )
-                
-                if not messages_data:
-                    self.logger.warning("처리할 메시지가 없습니다")
-                    return None
-                
-                # 메시지 선택 로직
                 selected_message = None
-                
                 if target_date:
-                    # 특정 날짜의 메시지 찾기
-                    self.logger.info(f"특정 날짜 메시지 검색: {target_date}")
-                    selected_message = find_message_by_date(messages_data, target_date)
-                    if selected_message:
-                        self.logger.info(f"날짜 {target_date}의 메시지 발견: {selected_message['subject']}")
-                    else:
-                        self.logger.warning(f"날짜 {target_date}의 메시지를 찾을 수 없습니다")
-                else:
-                    # 가장 최신 메시지 선택
-                    self.logger.info("가장 최신 메시지 선택")
-                    selected_message = find_latest_message(messages_data)
-                    if selected_message:
-                        parsed_date = parse_date_from_subject(selected_message['subject'])
-                        self.logger.info(f"최신 메시지 선택: {selected_message['subject']} (날짜: {parsed_date})")
+                    # 날짜 범위로 좁힌 검색을 먼저 시도
+                    selected_message = self._find_message_near_date(target_date)
+                
+                if not selected_message:
+                    # 발신자로부터 메시지 목록 추출
+                    self.logger.info(f"발신자로부터 메시지 목록 추출: {self.config.sender_name}")
+                    messages_data = self.email_extractor.list_messages_from_sender(
+                        self.config.sender_name, 
+                        self.config.max_results
+                    )
+                    
+                    if not messages_data:
+                        self.logger.warning("처리할 메시지가 없습니다")
+                        return None
+                    
+                    selected_message = self._select_message(messages_data, target_date)
                 
                 if not selected_message:
-                    self.logger.warning("선택할 수 있는 메시지가 없습니다")
                     return None
                 
                 return self.email_extractor.get_email_data(selected_message['id'])
@@ -123,35 +144,125 @@ class GmailTableExtractor(LoggerMixin):
             self.logger.error(f"이메일 데이터 추출 실패: {e}")
             raise
     
-    def save_email_html(self, email_data: EmailData) -> Optional[Path]:
+    def _find_message_near_date(self, target_date: str) -> Optional[Dict[str, Any]]:
+        """
+        Gmail 검색 조건에 날짜 범위를 추가하여 특정 날짜의 메시지를 찾습니다.
+        
+        서버에서 후보를 좁혀 메타데이터 조회 횟수를 줄입니다. 찾지 못하면 None을 반환하며,
+        이 경우 호출자는 전체 목록 검색으로 폴백합니다.
+        
+        Args:
+            target_date: 찾을 날짜 (YYYYMMDD 형식)
+            
+        Returns:
+            해당 날짜의 메시지 데이터 또는 None
+        """
+        try:
+            date_query = build_date_query(target_date)
+            self.logger.info(f"날짜 범위로 메시지 검색: {date_query}")
+            messages_data = self.email_extractor.list_messages_from_sender(
+                self.config.sender_name,
+                self.config.max_results,
+                extra_query=date_query,
+            )
+        except (ValidationError, EmailNotFoundError) as e:
+            self.logger.info(f"날짜 범위 검색 실패, 전체 목록으로 검색합니다: {e}")
+            return None
+        
+        selected_message = find_message_by_date(messages_data, target_date)
+        if selected_message:
+            self.logger.info(f"날짜 {target_date}의 메시지 발견: {selected_message['subject']}")
+        return selected_message
+    
+    def _select_message(
+        self,
+        messages_data: List[Dict[str, Any]],
+        target_date: Optional[str] = None,
+        date_index: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        메시지 목록에서 처리할 메시지를 선택합니다.
+        
+        Args:
+            messages_data: 메시지 데이터 목록
+            target_date: 특정 날짜의 메시지를 찾을 경우 (YYYYMMDD 형식)
+            date_index: 제목 날짜별 메시지 색인 (여러 날짜를 찾을 때 사용)
+            
+        Returns:
+            선택된 메시지 데이터 또는 None
+        """
+        selected_message = None
+        
+        if target_date:
+            # 특정 날짜의 메시지 찾기
+            self.logger.info(f"특정 날짜 메시지 검색: {target_date}")
+            selected_message = find_message_by_date(messages_data, target_date, date_index)
+            if selected_message:
+                self.logger.info(f"날짜 {target_date}의 메시지 발견: {selected_message['subject']}")
+            else:
+                self.logger.warning(f"날짜 {target_date}의 메시지를 찾을 수 없습니다")
+        else:
+            # 가장 최신 메시지 선택
+            self.logger.info("가장 최신 메시지 선택")
+            selected_message = find_latest_message(messages_data)
+            if selected_message:
+                parsed_date = selected_message.get('parsed_date')
+                self.logger.info(f"최신 메시지 선택: {selected_message['subject']} (날짜: {parsed_date})")
+        
+        if not selected_message:
+            self.logger.warning("선택할 수 있는 메시지가 없습니다")
+        return selected_message
+    
+    def build_email_html(self, email_data: EmailData) -> Optional[str]:
+        """
+        캡처할 HTML 문서를 생성합니다.
+        
+        Args:
+            email_data: 이메일 데이터
+            
+        Returns:
+            테이블이 있으면 테이블만, 없으면 본문 전체를 담은 HTML 문서 또는 None
+        """
+        if email_data.has_tables:
+            return create_table_html(email_data.tables_html)
+        if email_data.has_html:
+            return create_full_html(email_data.html_content)
+        return None
+    
+    def _output_stem(self, name_suffix: Optional[str] = None) -> str:
+        """
+        출력 파일명(확장자 제외)을 생성합니다.
+        
+        Args:
+            name_suffix: 파일명 뒤에 붙일 구분자 (여러 메시지를 한 번에 처리할 때 사용)
+            
+        Returns:
+            [발신자]_[타임스탬프] 형식의 파일명
+        """
+        stem = f"{clean_filename(self.config.sender_name)}_{generate_timestamp()}"
+        if name_suffix:
+            stem = f"{stem}_{clean_filename(name_suffix)}"
+        return stem
+    
+    def save_email_html(self, email_data: EmailData, name_suffix: Optional[str] = None) -> Optional[Path]:
         """
         이메일 HTML을 파일로 저장합니다.
         
         Args:
             email_data: 이메일 데이터
+            name_suffix: 파일명 뒤에 붙일 구분자 (여러 메시지를 한 번에 저장할 때 사용)
             
         Returns:
             저장된 HTML 파일 경로 또는 None
         """
         try:
-            if not email_data.has_html and not email_data.has_tables:
+            html_content = self.build_email_html(email_data)
+            if html_content is None:
                 self.logger.warning("저장할 HTML 내용이 없습니다")
                 return None
             
-            timestamp = generate_timestamp()
-            sender_clean = clean_filename(self.config.sender_name)
-            
-            if email_data.has_tables:
-                # 테이블이 있는 경우
-                html_content = create_table_html(email_data.tables_html)
-                filename = f"{sender_clean}_{timestamp}.html"
-                self.logger.info("테이블 HTML 저장")
-            else:
-                # 일반 HTML
-                html_content = create_full_html(email_data.html_content)
-                filename = f"{sender_clean}_{timestamp}.html"
-                self.logger.info("일반 HTML 저장")
-            
+            self.logger.info("테이블 HTML 저장" if email_data.has_tables else "일반 HTML 저장")
+            filename = f"{self._output_stem(name_suffix)}.html"
             file_path = save_html_file(html_content, filename, self.config.output_dir)
             self.logger.info(f"HTML 파일 저장 완료: {file_path}")
             return file_path
@@ -160,6 +271,25 @@ class GmailTableExtractor(LoggerMixin):
             self.logger.error(f"HTML 파일 저장 실패: {e}")
             raise
     
+    def process_html(self, html_content: str, name_suffix: Optional[str] = None) -> FilePaths:
+        """
+        HTML 문서를 디스크에 저장하지 않고 처리하여 테이블을 Excel로 변환합니다.
+        
+        Args:
+            html_content: 완전한 HTML 문서
+            name_suffix: 파일명 뒤에 붙일 구분자
+            
+        Returns:
+            생성된 파일 경로들 (save_html 설정 시 HTML 파일 포함)
+        """
+        try:
+            file_paths = self._render_html(html_content, name_suffix)
+            return self._extract_tables_to_excel(file_paths)
+            
+        except Exception as e:
+            self.logger.error(f"테이블 처리 실패: {e}")
+            raise
+    
     def process_tables(self, html_file: Path) -> FilePaths:
         """
         HTML 파일을 처리하여 테이블을 Excel로 변환합니다.
@@ -170,43 +300,101 @@ class GmailTableExtractor(LoggerMixin):
         Returns:
             생성된 파일 경로들
         """
-        file_paths = FilePaths(html_file=html_file)
-        
         try:
-            # 1. HTML을 이미지로 변환
-            self.logger.info("HTML을 이미지로 변환 중...")
-            png_file = capture_html_to_png(
-                html_file, 
-                full_page=self.config.full_page_capture,
-                device_scale_factor=self.config.device_scale_factor
-            )
-            file_paths.png_file = png_file
-            self.logger.info(f"이미지 저장 완료: {png_file}")
+            file_paths = self._capture_table_image(FilePaths(html_file=html_file))
+            return self._extract_tables_to_excel(file_paths)
             
-            # 2. Gemini로 테이블 추출
-            if not self.gemini_client:
-                self.initialize_gemini()
+        except Exception as e:
+            self.logger.error(f"테이블 처리 실패: {e}")
+            raise
+    
+    def _capture_table_image(self, file_paths: FilePaths) -> FilePaths:
+        """
+        HTML 파일을 이미지로 변환합니다.
+        
+        Args:
+            file_paths: html_file이 설정된 파일 경로 객체
             
-            self.logger.info("Gemini로 테이블 추출 중...")
-            table_data = self.gemini_client.table_image_to_json(png_file)
+        Returns:
+            png_file을 추가한 파일 경로 객체
+        """
+        from ..services.html_to_image import capture_html_to_png
+        
+        self.logger.info("HTML을 이미지로 변환 중...")
+        png_file = capture_html_to_png(
+            file_paths.html_file, 
+            full_page=self.config.full_page_capture,
+            device_scale_factor=self.config.device_scale_factor
+        )
+        self.logger.info(f"이미지 저장 완료: {png_file}")
+        return replace(file_paths, png_file=png_file)
+    
+    def _render_html(self, html_content: str, name_suffix: Optional[str] = None) -> FilePaths:
+        """
+        HTML 문서를 메모리에서 바로 이미지로 캡처합니다.
+        
+        save_html 설정이 켜져 있으면 디버깅용으로 HTML 파일도 저장합니다.
+        
+        Args:
+            html_content: 완전한 HTML 문서
+            name_suffix: 파일명 뒤에 붙일 구분자
             
-            # 3. JSON 파일 저장
-            json_file = html_file.with_suffix(".json")
-            save_json_file(table_data, json_file)
-            file_paths.json_file = json_file
-            self.logger.info(f"JSON 저장 완료: {json_file}")
+        Returns:
+            png_file(및 html_file)이 설정된 파일 경로 객체
+        """
+        from ..services.html_to_image import HTMLToImageConverter
+        
+        stem = self._output_stem(name_suffix)
+        html_file = None
+        
+        if self.config.save_html:
+            html_file = save_html_file(html_content, f"{stem}.html", self.config.output_dir)
+            self.logger.info(f"HTML 파일 저장 완료: {html_file}")
+        
+        self.logger.info("HTML을 이미지로 변환 중...")
+        png_file = HTMLToImageConverter().capture_html_to_png_from_string(
+            html_content, 
+            self.config.output_dir / f"{stem}.png",
+            full_page=self.config.full_page_capture,
+            device_scale_factor=self.config.device_scale_factor
+        )
+        self.logger.info(f"이미지 저장 완료: {png_file}")
+        return FilePaths(html_file=html_file, png_file=png_file)
+    
+    def _extract_tables_to_excel(self, file_paths: FilePaths) -> FilePaths:
+        """
+        이미지에서 테이블을 추출하여 JSON과 Excel 파일을 생성합니다.
+        
+        Args:
+            file_paths: png_file이 설정된 파일 경로 객체
+            
+        Returns:
+            json_file과 excel_file을 추가한 파일 경로 객체
+        """
+        from ..services.json_to_excel import dict_tables_to_excel
+        
+        # 1. Gemini로 테이블 추출
+        if not self.gemini_client:
+            self.initialize_gemini()
+        
+        self.logger.info("Gemini로 테이블 추출 중...")
+        table_data = self.gemini_client.table_image_to_json(file_paths.png_file)
+        
+        # 2. JSON 파일 저장과 Excel 생성을 동시에 수행
+        #    (Excel은 파싱된 데이터로 바로 만들므로 JSON 파일을 다시 읽지 않음)
+        json_file = file_paths.png_file.with_suffix(".json")
+        excel_file = file_paths.png_file.with_suffix(".xlsx")
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            json_future = executor.submit(save_json_file, table_data, json_file)
             
-            # 4. Excel 파일 생성
             self.logger.info("Excel 파일 생성 중...")
-            excel_file = json_tables_to_excel(json_file)
-            file_paths.excel_file = excel_file
+            excel_file = dict_tables_to_excel(table_data, excel_file)
             self.logger.info(f"Excel 저장 완료: {excel_file}")
             
-            return file_paths
-            
-        except Exception as e:
-            self.logger.error(f"테이블 처리 실패: {e}")
-            raise
+            json_future.result()
+            self.logger.info(f"JSON 저장 완료: {json_file}")
+        
+        return replace(file_paths, json_file=json_file, excel_file=excel_file)
     
     def run(self, target_date: Optional[str] = None) -> ProcessingResult:
         """
@@ -235,17 +423,17 @@ class GmailTableExtractor(LoggerMixin):
                     processing_time=time.time() - start_time
                 )
             
-            # 3. HTML 파일 저장
-            html_file = self.save_email_html(email_data)
-            if not html_file:
+            # 3. 캡처할 HTML 생성
+            html_content = self.build_email_html(email_data)
+            if not html_content:
                 return ProcessingResult(
                     success=False,
-                    message="저장할 HTML 내용이 없습니다",
+                    message="처리할 HTML 내용이 없습니다",
                     processing_time=time.time() - start_time
                 )
             
-            # 4. 테이블 처리 (이미지 → JSON → Excel)
-            file_paths = self.process_tables(html_file)
+            # 4. 테이블 처리 (HTML → 이미지 → JSON → Excel)
+            file_paths = self.process_html(html_content)
             
             processing_time = time.time() - start_time
             self.logger.info(f"워크플로우 완료 (소요시간: {processing_time:.2f}초)")
@@ -253,7 +441,7 @@ class GmailTableExtractor(LoggerMixin):
             return ProcessingResult(
                 success=True,
                 message="워크플로우가 성공적으로 완료되었습니다",
-                input_file=html_file,
+                input_file=file_paths.html_file,
                 output_files=file_paths.get_all_files(),
                 processing_time=processing_time
             )
@@ -268,3 +456,123 @@ class GmailTableExtractor(LoggerMixin):
                 error=e,
                 processing_time=processing_time
             )
+        finally:
+            self.close()
+    
+    def run_batch(self, target_dates: List[str], max_workers: int = 8) -> List[ProcessingResult]:
+        """
+        여러 날짜의 메시지를 한 번에 처리합니다.
+        
+        메시지 목록은 한 번만 조회하고 선택된 메시지 본문은 배치 요청으로 한 번에
+        가져옵니다. HTML 캡처는 브라우저를 스레드 간에 공유할 수 없으므로 순서대로 수행하고, 대부분의 시간을
+        차지하는 Gemini 호출과 JSON/Excel 생성은 스레드 풀에서 동시에 수행합니다.
+        같은 날짜가 여러 번 있으면 한 번만 처리하고 같은 결과를 돌려줍니다
+        (같은 출력 파일을 동시에 덮어쓰지 않도록).
+        
+        Args:
+            target_dates: 처리할 날짜 목록 (YYYYMMDD 형식)
+            max_workers: Gemini 호출에 사용할 최대 스레드 수
+            
+        Returns:
+            target_dates와 같은 순서의 처리 결과 목록
+        """
+        unique_dates = list(dict.fromkeys(target_dates))
+        try:
+            result_by_date = dict(zip(unique_dates, self._run_batch(unique_dates, max_workers)))
+        finally:
+            self.close()
+        return [result_by_date[target_date] for target_date in target_dates]
+    
+    def _run_batch(self, target_dates: List[str], max_workers: int) -> List[ProcessingResult]:
+        """run_batch의 실제 처리를 수행합니다."""
+        start_time = time.time()
+        results: List[Optional[ProcessingResult]] = [None] * len(target_dates)
+        
+        def failure(message: str, error: Optional[Exception] = None) -> ProcessingResult:
+            return ProcessingResult(
+                success=False,
+                message=message,
+                error=error,
+                processing_time=time.time() - start_time
+            )
+        
+        try:
+            self.logger.info(f"일괄 처리 시작: {len(target_dates)}개 날짜")
+            self.authenticate()
+            messages_data = self.email_extractor.list_messages_from_sender(
+                self.config.sender_name, 
+                self.config.max_results
+            )
+            if not self.gemini_client:
+                self.initialize_gemini()
+        except Exception as e:
+            self.logger.error(f"일괄 처리 준비 중 오류: {e}")
+            return [failure(f"워크플로우 실행 중 오류 발생: {e}", e) for _ in target_dates]
+        
+        # 1. 날짜별 메시지 선택 (목록은 색인을 만들 때 한 번만 순회)
+        date_index = build_date_index(messages_data)
+        selected: List[Tuple[int, str]] = []
+        for idx, target_date in enumerate(target_dates):
+            selected_message = self._select_message(messages_data, target_date, date_index)
+            if selected_message:
+                selected.append((idx, selected_message['id']))
+            else:
+                results[idx] = failure(f"날짜 {target_date}의 메시지가 없습니다")
+        
+        # 2. 선택된 메시지를 배치 요청으로 한 번에 조회
+        email_by_id: Dict[str, EmailData] = {}
+        if selected:
+            message_ids = list(dict.fromkeys(msg_id for _, msg_id in selected))
+            try:
+                email_by_id = dict(
+                    zip(message_ids, self.email_extractor.get_email_data_batch(message_ids))
+                )
+            except Exception as e:
+                self.logger.error(f"메시지 일괄 조회 중 오류: {e}")
+                for idx, _ in selected:
+                    results[idx] = failure(f"워크플로우 실행 중 오류 발생: {e}", e)
+                selected = []
+        
+        # 3. 이미지 캡처 (순차)
+        pending: List[Tuple[int, FilePaths]] = []
+        for idx, msg_id in selected:
+            target_date = target_dates[idx]
+            try:
+                html_content = self.build_email_html(email_by_id[msg_id])
+                if not html_content:
+                    results[idx] = failure("처리할 HTML 내용이 없습니다")
+                    continue
+                
+                pending.append((idx, self._render_html(html_content, name_suffix=target_date)))
+            except Exception as e:
+                self.logger.error(f"날짜 {target_date} 처리 중 오류: {e}")
+                results[idx] = failure(f"워크플로우 실행 중 오류 발생: {e}", e)
+        
+        # 4. Gemini 테이블 추출 및 JSON/Excel 생성 (병렬)
+        if pending:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as executor:
+                futures = {
+                    executor.submit(self._extract_tables_to_excel, file_paths): idx
+                    for idx, file_paths in pending
+                }
+                for future in as_completed(futures):
+                    idx = futures[future]
+                    try:
+                        file_paths = future.result()
+                        results[idx] = ProcessingResult(
+                            success=True,
+                            message="워크플로우가 성공적으로 완료되었습니다",
+                            input_file=file_paths.html_file,
+                            output_files=file_paths.get_all_files(),
+                            processing_time=time.time() - start_time
+                        )
+                    except Exception as e:
+                        self.logger.error(f"날짜 {target_dates[idx]} 테이블 처리 실패: {e}")
+                        results[idx] = failure(f"워크플로우 실행 중 오류 발생: {e}", e)
+        
+        succeeded = sum(1 for r in results if r and r.success)
+        self.logger.info(
+            f"일괄 처리 완료: {succeeded}/{len(target_dates)}건 성공 "
+            f"(소요시간: {time.time() - start_time:.2f}초)"
+        )
+        return results
@@ -2,13 +2,13 @@
 데이터 모델 클래스들
 애플리케이션에서 사용되는 데이터 구조를 정의합니다.
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple, FrozenSet
 from datetime import datetime
 
 
-@dataclass
+@dataclass(frozen=True, slots=True, eq=False)
 class EmailData:
     """이메일 데이터를 담는 클래스"""
     message_id: str
@@ -30,43 +30,37 @@ class EmailData:
         return bool(self.html_content and self.html_content.strip())
 
 
-@dataclass
+@dataclass(frozen=True, slots=True, eq=False)
 class TableData:
     """테이블 데이터를 담는 클래스"""
     headers: List[str]
     rows: List[List[Optional[str]]]
+    # 행/열 개수 (생성 시 한 번만 계산)
+    row_count: int = field(init=False, repr=False)
+    col_count: int = field(init=False, repr=False)
     
-    @property
-    def row_count(self) -> int:
-        """행 개수를 반환합니다."""
-        return len(self.rows)
-    
-    @property
-    def col_count(self) -> int:
-        """열 개수를 반환합니다."""
-        return len(self.headers) if self.headers else 0
+    def __post_init__(self):
+        # frozen 데이터클래스이므로 object.__setattr__로 설정
+        object.__setattr__(self, "row_count", len(self.rows))
+        object.__setattr__(self, "col_count", len(self.headers) if self.headers else 0)
     
     def is_empty(self) -> bool:
         """테이블이 비어있는지 확인합니다."""
         return self.row_count == 0 or self.col_count == 0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True, eq=False)
 class ProcessingResult:
     """처리 결과를 담는 클래스"""
     success: bool
     message: str
     input_file: Optional[Path] = None
-    output_files: List[Path] = None
+    output_files: Tuple[Path, ...] = ()
     error: Optional[Exception] = None
     processing_time: Optional[float] = None
-    
-    def __post_init__(self):
-        if self.output_files is None:
-            self.output_files = []
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FilePaths:
     """파일 경로들을 관리하는 클래스"""
     html_file: Optional[Path] = None
@@ -74,9 +68,15 @@ class FilePaths:
     json_file: Optional[Path] = None
     excel_file: Optional[Path] = None
     
-    def get_all_files(self) -> List[Path]:
+    def get_all_files(self) -> Tuple[Path, ...]:
         """모든 파일 경로를 반환합니다."""
-        return [f for f in [self.html_file, self.png_file, self.json_file, self.excel_file] if f is not None]
+        return tuple(
+            f for f in (self.html_file, self.png_file, self.json_file, self.excel_file) if f is not None
+        )
+    
+    def get_all_files_set(self) -> FrozenSet[Path]:
+        """포함 여부 확인용으로 모든 파일 경로를 집합으로 반환합니다."""
+        return frozenset(self.get_all_files())
     
     def get_existing_files(self) -> List[Path]:
         """존재하는 파일들만 반환합니다."""
@@ -4,24 +4,124 @@ Google Gemini API를 사용하여 이미지에서 테이블을 추출합니다.
 """
 import os
 import getpass
+import hashlib
+import io
 import json
-import base64
-import mimetypes
+import re
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 
 from google import genai
+from google.genai import types
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow가 없으면 원본 이미지를 그대로 전송
+    Image = None
 
 from ..utils.exceptions import AIParsingError, ConfigurationError
 from ..utils.logger import LoggerMixin
+from ..utils.utils import save_json_file, loads_json
+
+# 이미지 확장자별 MIME 타입 (알 수 없으면 image/png)
+_IMAGE_MIME_TYPES = {
+    "png": "image/png",
+    "jpg": "image/jpeg",
+    "jpeg": "image/jpeg",
+    "webp": "image/webp",
+}
+
+# 테이블 추출에 사용할 모델
+_TABLE_MODEL = "gemini-2.5-flash"
+
+# 테이블 추출 프롬프트 및 생성 설정 (호출마다 재생성하지 않도록 모듈 수준에서 한 번만 생성)
+_TABLE_PROMPT = (
+    "You are an expert at table extraction. "
+    "Extract ALL tables from the provided image and return STRICT JSON only. "
+    "Do not include any commentary. Schema: {\n"
+    "  \"tables\": [ { \n"
+    "    \"headers\": [string, ...], \n"
+    "    \"rows\": [ [string|null, ...], ... ] \n"
+    "  } ]\n"
+    "}. Use null for empty cells."
+)
+
+_TABLE_CONFIG = types.GenerateContentConfig(
+    response_mime_type="application/json",
+    temperature=0.2,
+)
+
+# 응답 캐시 키에 섞는 값 (모델이나 프롬프트가 바뀌면 이전 캐시를 사용하지 않음)
+# 응답 처리 방식이 바뀌어 기존 캐시를 무효화해야 하면 버전을 올립니다.
+_CACHE_VERSION = 1
+_CACHE_SALT = hashlib.sha256(
+    f"{_CACHE_VERSION}\n{_TABLE_MODEL}\n{_TABLE_PROMPT}".encode("utf-8")
+).digest()
+
+# 응답을 감싸는 ```json ... ``` 코드펜스
+_FENCE_RE = re.compile(r"^```(?:json)?\s*|\s*```$")
+
+
+def _find_json_object(text: str) -> Optional[str]:
+    """
+    텍스트에서 첫 번째로 완결된 JSON 객체 구간을 한 번의 순회로 찾습니다.
+    
+    문자열 리터럴 안의 중괄호는 무시합니다.
+    
+    Args:
+        text: 검색할 텍스트
+        
+    Returns:
+        JSON 객체 문자열 또는 None
+    """
+    start = text.find("{")
+    if start == -1:
+        return None
+    
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start : i + 1]
+    return None
 
 
 class GeminiAPIClient(LoggerMixin):
     """Gemini API 클라이언트"""
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache_dir: Optional[Path] = None,
+        max_image_width: Optional[int] = 1500,
+    ):
+        """
+        Args:
+            api_key: Gemini API 키 (None이면 환경변수 또는 입력으로 가져옴)
+            cache_dir: 응답 캐시 디렉토리 (None이면 캐시를 사용하지 않음)
+            max_image_width: 전송 전 이미지 최대 너비 (None 또는 0이면 축소하지 않음)
+        """
         self.api_key = api_key or self._get_api_key()
         self.client = genai.Client(api_key=self.api_key)
+        self.cache_dir = cache_dir
+        self.max_image_width = max_image_width
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
     
     def _get_api_key(self) -> str:
         """
@@ -56,54 +156,44 @@ class GeminiAPIClient(LoggerMixin):
             추출된 테이블 데이터 ({"tables": [{"headers": [...], "rows": [[...], ...]}]})
             
         Raises:
+            FileNotFoundError: 이미지 파일이 없을 때
             AIParsingError: 파싱 실패 시
         """
         p = Path(image_path)
-        if not p.exists():
-            raise FileNotFoundError(f"이미지 파일을 찾을 수 없습니다: {p}")
+        # 파일이 없으면 FileNotFoundError가 그대로 전달됩니다.
+        image_bytes = p.read_bytes()
 
         try:
             self.logger.info(f"이미지에서 테이블 추출 시작: {p}")
             
-            mime, _ = mimetypes.guess_type(str(p))
-            if mime is None:
-                mime = "image/png"
-
-            image_bytes = p.read_bytes()
-            b64 = base64.b64encode(image_bytes).decode("ascii")
-
-            prompt = (
-                "You are an expert at table extraction. "
-                "Extract ALL tables from the provided image and return STRICT JSON only. "
-                "Do not include any commentary. Schema: {\n"
-                "  \"tables\": [ { \n"
-                "    \"headers\": [string, ...], \n"
-                "    \"rows\": [ [string|null, ...], ... ] \n"
-                "  } ]\n"
-                "}. Use null for empty cells."
-            )
+            mime = _IMAGE_MIME_TYPES.get(p.suffix.lower().lstrip("."), "image/png")
+            
+            # 동일한 이미지는 캐시된 결과를 반환
+            cache_file = self._cache_file(image_bytes)
+            cached = self._load_cached(cache_file)
+            if cached is not None:
+                self.logger.info(f"캐시된 테이블 추출 결과 사용: {cache_file}")
+                return cached
 
-            config = {
-                "response_mime_type": "application/json",
-                "temperature": 0.2,
-            }
+            image_bytes, mime = self._downscale_image(image_bytes, mime)
 
             response = self.client.models.generate_content(
-                model="gemini-2.5-flash",
+                model=_TABLE_MODEL,
                 contents=[
-                    {
-                        "role": "user",
-                        "parts": [
-                            {"text": prompt},
-                            {"inline_data": {"mime_type": mime, "data": b64}},
+                    types.Content(
+                        role="user",
+                        parts=[
+                            types.Part(text=_TABLE_PROMPT),
+                            types.Part.from_bytes(data=image_bytes, mime_type=mime),
                         ],
-                    }
+                    )
                 ],
-                config=config,
+                config=_TABLE_CONFIG,
             )
 
             text = response.text or "{}"
             result = self._parse_json_response(text)
+            self._store_cached(cache_file, result)
             
             self.logger.info("테이블 추출 완료")
             return result
@@ -112,6 +202,65 @@ class GeminiAPIClient(LoggerMixin):
             self.logger.error(f"테이블 추출 실패: {e}")
             raise AIParsingError(f"테이블 추출 실패: {e}")
     
+    def _downscale_image(self, image_bytes: bytes, mime: str) -> Tuple[bytes, str]:
+        """
+        이미지가 최대 너비보다 크면 비율을 유지한 채 축소합니다.
+        
+        전체 페이지 캡처는 세로로 길기 때문에 높이는 제한하지 않고 너비만 맞춥니다.
+        
+        Args:
+            image_bytes: 원본 이미지 바이트
+            mime: 원본 이미지 MIME 타입
+            
+        Returns:
+            (전송할 이미지 바이트, MIME 타입)
+        """
+        if Image is None or not self.max_image_width:
+            return image_bytes, mime
+        
+        with Image.open(io.BytesIO(image_bytes)) as img:
+            if img.width <= self.max_image_width:
+                return image_bytes, mime
+            
+            height = max(1, round(img.height * self.max_image_width / img.width))
+            resized = img.resize((self.max_image_width, height), Image.LANCZOS)
+        
+        buf = io.BytesIO()
+        resized.save(buf, format="PNG", optimize=True)
+        self.logger.debug(
+            "이미지 축소: %dx%d → %dx%d (%d → %d bytes)",
+            img.width, img.height, resized.width, resized.height, len(image_bytes), buf.tell()
+        )
+        return buf.getvalue(), "image/png"
+    
+    def _cache_file(self, image_bytes: bytes) -> Optional[Path]:
+        """모델·프롬프트와 이미지 내용의 SHA-256 해시로 캐시 파일 경로를 만듭니다."""
+        if self.cache_dir is None:
+            return None
+        digest = hashlib.sha256(_CACHE_SALT + image_bytes).hexdigest()
+        return self.cache_dir / f"{digest}.json"
+    
+    def _load_cached(self, cache_file: Optional[Path]) -> Optional[Dict[str, Any]]:
+        """캐시된 결과를 로드합니다. 없거나 읽을 수 없으면 None을 반환합니다."""
+        if cache_file is None:
+            return None
+        try:
+            return loads_json(cache_file.read_bytes())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.warning(f"캐시 로드 실패, 다시 추출합니다: {e}")
+            return None
+    
+    def _store_cached(self, cache_file: Optional[Path], result: Dict[str, Any]) -> None:
+        """추출 결과를 캐시에 저장합니다. 실패해도 처리를 중단하지 않습니다."""
+        if cache_file is None:
+            return
+        try:
+            save_json_file(result, cache_file)
+        except Exception as e:
+            self.logger.warning(f"캐시 저장 실패: {e}")
+    
     def _parse_json_response(self, text: str) -> Dict[str, Any]:
         """
         Gemini 응답에서 JSON을 파싱합니다.
@@ -126,24 +275,16 @@ class GeminiAPIClient(LoggerMixin):
             AIParsingError: JSON 파싱 실패 시
         """
         # 코드펜스 제거 등 방어적 처리
-        text = text.strip()
-        if text.startswith("```"):
-            # ```json ... ``` 형태 제거
-            text = text.strip("`")
-            if text.startswith("json"):
-                text = text[4:]
-            text = text.strip()
+        text = _FENCE_RE.sub("", text.strip())
         
         try:
-            return json.loads(text)
+            return loads_json(text)
         except json.JSONDecodeError:
-            # 마지막 시도: 중괄호 범위 추출
-            start = text.find("{")
-            end = text.rfind("}")
-            if start != -1 and end != -1 and end > start:
-                return json.loads(text[start : end + 1])
-            else:
+            # 마지막 시도: 첫 번째로 완결된 JSON 객체 추출
+            candidate = _find_json_object(text)
+            if candidate is None:
                 raise AIParsingError("JSON 파싱 실패: 유효한 JSON을 찾을 수 없습니다")
+            return loads_json(candidate)
 
 
 # 하위 호환성을 위한 함수들
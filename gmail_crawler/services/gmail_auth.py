@@ -4,7 +4,7 @@ Gmail API 인증 및 서비스 빌드를 담당합니다.
 """
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
@@ -13,10 +13,14 @@ from googleapiclient.errors import HttpError
 
 from ..utils.exceptions import AuthenticationError
 from ..utils.logger import LoggerMixin
+from .http_transport import RequestsHttp
 
 # 필요한 권한만: 읽기 전용
 SCOPES = ["https://www.googleapis.com/auth/gmail.readonly"]
 
+# 토큰 파일 경로별로 생성한 Gmail 서비스 (재인증 시 재사용)
+_service_cache: Dict[Path, Any] = {}
+
 
 class GmailAuthenticator(LoggerMixin):
     """Gmail API 인증을 담당하는 클래스"""
@@ -35,6 +39,11 @@ class GmailAuthenticator(LoggerMixin):
         Raises:
             AuthenticationError: 인증 실패 시
         """
+        cached = _service_cache.get(self.token_file)
+        if cached is not None:
+            self.logger.info("기존 Gmail API 서비스 재사용")
+            return cached
+        
         try:
             self.logger.info("Gmail API 인증 시작")
             
@@ -43,7 +52,13 @@ class GmailAuthenticator(LoggerMixin):
             if not creds or not creds.valid:
                 creds = self._refresh_or_create_credentials(creds)
             
-            service = build("gmail", "v1", credentials=creds)
+            # 패키지에 포함된 디스커버리 문서를 사용하여 네트워크 요청을 생략하고,
+            # API 호출은 연결 풀을 재사용하는 requests 세션으로 보냄
+            service = build(
+                "gmail", "v1", http=RequestsHttp(creds),
+                cache_discovery=False, static_discovery=True,
+            )
+            _service_cache[self.token_file] = service
             self.logger.info("Gmail API 인증 완료")
             return service
             
@@ -2,13 +2,9 @@
 HTML을 이미지로 변환하는 모듈
 Playwright를 사용하여 HTML을 PNG 이미지로 캡처합니다.
 """
+import atexit
 from pathlib import Path
-from typing import Optional
-
-try:
-    from playwright.sync_api import sync_playwright
-except Exception:
-    sync_playwright = None
+from typing import Any, Callable, Optional
 
 from ..utils.exceptions import FileProcessingError
 from ..utils.logger import LoggerMixin
@@ -17,12 +13,45 @@ from ..utils.logger import LoggerMixin
 class HTMLToImageConverter(LoggerMixin):
     """HTML을 이미지로 변환하는 클래스"""
     
-    def __init__(self):
-        if sync_playwright is None:
-            raise RuntimeError(
-                "Playwright가 설치되어 있지 않습니다. "
-                "venv에서 'playwright install chromium'을 먼저 실행하세요."
-            )
+    # 모든 인스턴스가 공유하는 Playwright 및 브라우저 (최초 사용 시 실행)
+    _playwright: Any = None
+    _browser: Any = None
+    
+    @classmethod
+    def _get_browser(cls) -> Any:
+        """
+        공유 Chromium 브라우저를 반환합니다. 처음 호출될 때 한 번만 실행합니다.
+        
+        Returns:
+            Playwright 브라우저 객체
+        """
+        if cls._browser is None:
+            try:
+                # playwright는 import 비용이 크므로 처음 캡처할 때 로드합니다.
+                from playwright.sync_api import sync_playwright
+            except Exception:
+                raise RuntimeError(
+                    "Playwright가 설치되어 있지 않습니다. "
+                    "venv에서 'playwright install chromium'을 먼저 실행하세요."
+                )
+            cls._playwright = sync_playwright().start()
+            try:
+                cls._browser = cls._playwright.chromium.launch()
+            except Exception:
+                cls.close_browser()
+                raise
+            atexit.register(cls.close_browser)
+        return cls._browser
+    
+    @classmethod
+    def close_browser(cls) -> None:
+        """공유 브라우저와 Playwright를 종료합니다."""
+        if cls._browser is not None:
+            cls._browser.close()
+            cls._browser = None
+        if cls._playwright is not None:
+            cls._playwright.stop()
+            cls._playwright = None
     
     def capture_html_to_png(
         self, 
@@ -48,22 +77,58 @@ class HTMLToImageConverter(LoggerMixin):
             FileProcessingError: 이미지 생성 실패 시
         """
         try:
-            if not html_path.exists():
-                raise FileNotFoundError(f"HTML 파일이 존재하지 않습니다: {html_path}")
-            
             self.logger.info(f"HTML을 이미지로 변환 시작: {html_path}")
             
             html_uri = html_path.resolve().as_uri()
             if out_png is None:
                 out_png = html_path.with_suffix(".png")
 
-            with sync_playwright() as p:
-                browser = p.chromium.launch()
-                context = browser.new_context(device_scale_factor=device_scale_factor)
-                page = context.new_page()
-                page.goto(html_uri, wait_until="load")
-                page.screenshot(path=str(out_png), full_page=full_page)
-                browser.close()
+            self._screenshot(
+                lambda page: page.goto(html_uri, wait_until="load"),
+                out_png,
+                full_page=full_page,
+                device_scale_factor=device_scale_factor,
+            )
+            
+            self.logger.info(f"이미지 저장 완료: {out_png}")
+            return out_png
+            
+        except Exception as e:
+            self.logger.error(f"이미지 생성 실패: {e}")
+            raise FileProcessingError(f"이미지 생성 실패: {e}")
+    
+    def capture_html_to_png_from_string(
+        self, 
+        html: str, 
+        out_png: Path, 
+        *, 
+        full_page: bool = True, 
+        device_scale_factor: int = 2
+    ) -> Path:
+        """
+        HTML 문자열을 파일로 저장하지 않고 바로 PNG 이미지로 캡처합니다.
+        
+        Args:
+            html: 완전한 HTML 문서
+            out_png: 출력 PNG 파일 경로
+            full_page: 전체 페이지 캡처 여부
+            device_scale_factor: 디바이스 스케일 팩터
+            
+        Returns:
+            생성된 PNG 파일 경로
+            
+        Raises:
+            FileProcessingError: 이미지 생성 실패 시
+        """
+        try:
+            self.logger.info(f"HTML 문자열을 이미지로 변환 시작 ({len(html)}자)")
+            
+            self._screenshot(
+                lambda page: page.set_content(html, wait_until="load"),
+                out_png,
+                full_page=full_page,
+                device_scale_factor=device_scale_factor,
+            )
             
             self.logger.info(f"이미지 저장 완료: {out_png}")
             return out_png
@@ -71,6 +136,23 @@ class HTMLToImageConverter(LoggerMixin):
         except Exception as e:
             self.logger.error(f"이미지 생성 실패: {e}")
             raise FileProcessingError(f"이미지 생성 실패: {e}")
+    
+    def _screenshot(
+        self, 
+        load: Callable[[Any], Any], 
+        out_png: Path, 
+        *, 
+        full_page: bool, 
+        device_scale_factor: int
+    ) -> None:
+        """새 브라우저 컨텍스트에서 load(page)로 페이지를 불러온 뒤 캡처합니다."""
+        context = self._get_browser().new_context(device_scale_factor=device_scale_factor)
+        try:
+            page = context.new_page()
+            load(page)
+            page.screenshot(path=str(out_png), full_page=full_page)
+        finally:
+            context.close()
 
 
 # 하위 호환성을 위한 함수
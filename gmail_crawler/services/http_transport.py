@@ -0,0 +1,78 @@
+"""
+Gmail API HTTP 전송 모듈
+googleapiclient가 사용하는 httplib2.Http 인터페이스를 requests 세션으로 구현합니다.
+"""
+from typing import Any, Dict, Optional, Tuple
+
+import httplib2
+from google.auth.credentials import Credentials
+from google.auth.transport.requests import AuthorizedSession
+from requests.adapters import HTTPAdapter
+
+# 연결 풀 크기 (동시 요청 수보다 크게 유지)
+_POOL_SIZE = 32
+
+# 요청 타임아웃(초), googleapiclient.http.build_http의 기본값과 동일
+_HTTP_TIMEOUT = 60
+
+
+class RequestsHttp:
+    """
+    requests 연결 풀을 사용하는 httplib2.Http 호환 객체
+    
+    httplib2는 요청마다 연결을 새로 맺는 경우가 많지만, requests 세션은 TCP/TLS 연결을
+    풀에 보관하여 재사용합니다. 세션의 연결 풀은 스레드 간에 공유할 수 있습니다.
+    """
+    
+    def __init__(self, credentials: Credentials, pool_size: int = _POOL_SIZE, timeout: float = _HTTP_TIMEOUT):
+        """
+        Args:
+            credentials: Google 인증 정보 (만료 시 세션이 자동으로 갱신)
+            pool_size: 연결 풀 크기
+            timeout: 요청 타임아웃(초)
+        """
+        # BatchHttpRequest가 하위 요청에 인증 헤더를 적용할 때 참조합니다.
+        self.credentials = credentials
+        self.timeout = timeout
+        self.session = AuthorizedSession(credentials)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+    
+    def request(
+        self,
+        uri: str,
+        method: str = "GET",
+        body: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        redirections: int = httplib2.DEFAULT_MAX_REDIRECTS,
+        connection_type: Any = None,
+    ) -> Tuple[httplib2.Response, bytes]:
+        """
+        httplib2.Http.request와 같은 형식으로 요청을 보냅니다.
+        
+        Args:
+            uri: 요청 URI
+            method: HTTP 메서드
+            body: 요청 본문
+            headers: 요청 헤더
+            redirections: 최대 리다이렉트 횟수
+            connection_type: 사용하지 않음 (httplib2 호환용)
+        
+        Returns:
+            (httplib2.Response, 응답 본문)
+        """
+        self.session.max_redirects = redirections
+        response = self.session.request(
+            method, uri, data=body, headers=headers, timeout=self.timeout
+        )
+        
+        info = dict(response.headers)
+        info["status"] = str(response.status_code)
+        resp = httplib2.Response(info)
+        resp.reason = response.reason
+        return resp, response.content
+    
+    def close(self) -> None:
+        """연결 풀을 닫습니다."""
+        self.session.close()
@@ -1,14 +1,12 @@
 """
 JSON 테이블 데이터를 Excel 파일로 변환하는 모듈
 """
-import json
 from pathlib import Path
-from typing import Any, List, Optional
-
-import pandas as pd
+from typing import Any, Dict, Iterator, List, Optional
 
 from ..utils.exceptions import FileProcessingError, ValidationError
 from ..utils.logger import LoggerMixin
+from ..utils.utils import loads_json
 
 
 class JSONToExcelConverter(LoggerMixin):
@@ -17,26 +15,27 @@ class JSONToExcelConverter(LoggerMixin):
     def __init__(self):
         pass
     
-    def _normalize_rows(self, rows: List[List[Any]], num_cols: int) -> List[List[Any]]:
+    def _normalize_rows(self, rows: List[List[Any]], num_cols: int) -> Iterator[List[Any]]:
         """
         행 데이터를 정규화합니다.
         
+        부족한 셀은 None으로 채우고 넘치는 셀은 잘라내며, 중간 배열 없이 한 행씩 생성합니다.
+        
         Args:
             rows: 원본 행 데이터
             num_cols: 목표 열 개수
             
-        Returns:
-            정규화된 행 데이터
+        Yields:
+            길이가 num_cols인 행
         """
-        normalized: List[List[Any]] = []
         for row in rows:
-            normalized_row = list(row)
-            if len(normalized_row) < num_cols:
-                normalized_row.extend([None] * (num_cols - len(normalized_row)))
-            elif len(normalized_row) > num_cols:
-                normalized_row = normalized_row[:num_cols]
-            normalized.append(normalized_row)
-        return normalized
+            k = len(row)
+            if k == num_cols:
+                yield row
+            elif k > num_cols:
+                yield row[:num_cols]
+            else:
+                yield row + [None] * (num_cols - k)
     
     def json_tables_to_excel(self, json_path: str | Path, out_xlsx: Optional[str | Path] = None) -> Path:
         """
@@ -51,29 +50,53 @@ class JSONToExcelConverter(LoggerMixin):
             
         Raises:
             FileProcessingError: 파일 처리 실패 시
-            ValidationError: 데이터 검증 실패 시
         """
+        json_file = Path(json_path)
         try:
-            json_file = Path(json_path)
-            if not json_file.exists():
-                raise FileNotFoundError(f"JSON 파일을 찾을 수 없습니다: {json_file}")
-            
             self.logger.info(f"JSON을 Excel로 변환 시작: {json_file}")
+            data = loads_json(json_file.read_bytes())
+        except Exception as e:
+            self.logger.error(f"Excel 변환 실패: {e}")
+            raise FileProcessingError(f"Excel 변환 실패: {e}")
+        
+        if out_xlsx is None:
+            out_xlsx = json_file.with_suffix(".xlsx")
+        return self.dict_tables_to_excel(data, out_xlsx)
+    
+    def dict_tables_to_excel(self, data: Dict[str, Any], out_xlsx: str | Path) -> Path:
+        """
+        이미 파싱된 테이블 데이터를 Excel 파일로 변환합니다.
+        
+        Args:
+            data: 테이블 데이터 ({"tables": [{"headers": [...], "rows": [[...], ...]}]})
+            out_xlsx: 출력 Excel 파일 경로
+            
+        Returns:
+            생성된 Excel 파일 경로
+            
+        Raises:
+            FileProcessingError: 파일 처리 실패 시
+            ValidationError: 데이터 검증 실패 시
+        """
+        try:
+            # xlsxwriter는 실제 변환 시점에 로드합니다.
+            import xlsxwriter
             
-            # JSON 데이터 로드
-            data = json.loads(json_file.read_text(encoding="utf-8"))
             tables = data.get("tables") or []
             
             if not isinstance(tables, list) or not tables:
                 raise ValidationError("JSON에 tables 항목이 없거나 비어있습니다.")
             
-            # 출력 파일 경로 설정
-            if out_xlsx is None:
-                out_xlsx = json_file.with_suffix(".xlsx")
             out_path = Path(out_xlsx)
             
             # Excel 파일 생성
-            with pd.ExcelWriter(out_path, engine="openpyxl") as writer:
+            # constant_memory 모드는 행을 즉시 파일에 기록하므로 반드시 행 순서대로 써야 합니다.
+            with xlsxwriter.Workbook(
+                str(out_path), {"constant_memory": True, "strings_to_urls": False}
+            ) as workbook:
+                header_format = workbook.add_format(
+                    {"bold": True, "border": 1, "align": "center", "valign": "top"}
+                )
                 for idx, table in enumerate(tables, start=1):
                     headers = table.get("headers") or []
                     rows = table.get("rows") or []
@@ -89,14 +112,13 @@ class JSONToExcelConverter(LoggerMixin):
                     if not headers:
                         headers = [f"col_{i+1}" for i in range(num_cols)]
                     
-                    # DataFrame 생성 및 저장
-                    df = pd.DataFrame(rows_norm, columns=headers)
-                    sheet_name = f"Table{idx}"
-                    df.to_excel(writer, index=False, sheet_name=sheet_name)
-                    
-                    self.logger.info(f"테이블 {idx} 변환 완료: {len(rows_norm)}행, {len(headers)}열")
+                    # 시트 작성 (헤더 → 데이터 행)
+                    worksheet = workbook.add_worksheet(f"Table{idx}")
+                    worksheet.write_row(0, 0, headers, header_format)
+                    for row_idx, row in enumerate(rows_norm, start=1):
+                        worksheet.write_row(row_idx, 0, row)
             
-            self.logger.info(f"Excel 저장 완료: {out_path}")
+            self.logger.info(f"Excel 저장 완료: {out_path} (테이블 {len(tables)}개)")
             return out_path
             
         except Exception as e:
@@ -111,3 +133,9 @@ def json_tables_to_excel(json_path: str | Path, out_xlsx: Optional[str | Path] =
     return converter.json_tables_to_excel(json_path, out_xlsx)
 
 
+def dict_tables_to_excel(data: Dict[str, Any], out_xlsx: str | Path) -> Path:
+    """파싱된 테이블 데이터를 Excel 파일로 변환합니다."""
+    converter = JSONToExcelConverter()
+    return converter.dict_tables_to_excel(data, out_xlsx)
+
+
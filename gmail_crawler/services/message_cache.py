@@ -0,0 +1,131 @@
+"""
+Gmail 메시지 캐시 모듈
+Gmail API 응답을 SQLite에 저장하여 실행 간에 재사용합니다.
+"""
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from ..utils.logger import LoggerMixin
+from ..utils.utils import loads_json
+
+# 메시지 본문(라벨 제외)은 변경되지 않으므로 (메시지 ID, 응답 종류)로 캐시합니다.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS msg_cache (
+    id TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    data BLOB NOT NULL,
+    fetched_at INTEGER NOT NULL,
+    PRIMARY KEY (id, kind)
+)
+"""
+
+# 한 번의 SELECT에 넣을 최대 파라미터 수 (SQLite 기본 한도 999 이하)
+_SELECT_CHUNK = 500
+
+
+class MessageCache(LoggerMixin):
+    """Gmail 메시지 응답을 저장하는 SQLite 캐시"""
+    
+    def __init__(self, db_file: Path, ttl: Optional[int] = None):
+        """
+        Args:
+            db_file: SQLite 데이터베이스 파일 경로
+            ttl: 캐시 유효 시간(초) (None 또는 0이면 만료되지 않음)
+        """
+        self.db_file = Path(db_file)
+        self.ttl = ttl or None
+        self._lock = threading.Lock()
+        
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_file), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+    
+    def get(self, message_id: str, kind: str) -> Optional[Dict[str, Any]]:
+        """
+        캐시된 응답을 가져옵니다.
+        
+        Args:
+            message_id: 메시지 ID
+            kind: 응답 종류 ("metadata" 또는 "full")
+        
+        Returns:
+            캐시된 응답 또는 None
+        """
+        return self.get_many([message_id], kind).get(message_id)
+    
+    def get_many(self, message_ids: Iterable[str], kind: str) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 메시지의 캐시된 응답을 가져옵니다.
+        
+        Args:
+            message_ids: 메시지 ID 목록
+            kind: 응답 종류 ("metadata" 또는 "full")
+        
+        Returns:
+            메시지 ID별 캐시된 응답 (캐시에 없거나 만료된 메시지는 제외)
+        """
+        ids = list(dict.fromkeys(message_ids))
+        min_fetched_at = int(time.time()) - self.ttl if self.ttl else 0
+        
+        found: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            for start in range(0, len(ids), _SELECT_CHUNK):
+                chunk = ids[start:start + _SELECT_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT id, data FROM msg_cache "
+                    f"WHERE kind = ? AND fetched_at >= ? AND id IN ({placeholders})",
+                    (kind, min_fetched_at, *chunk),
+                ).fetchall()
+                for message_id, data in rows:
+                    found[message_id] = loads_json(data)
+        return found
+    
+    def put(self, message_id: str, kind: str, data: Dict[str, Any]) -> None:
+        """
+        응답을 캐시에 저장합니다.
+        
+        Args:
+            message_id: 메시지 ID
+            kind: 응답 종류 ("metadata" 또는 "full")
+            data: Gmail API 응답
+        """
+        self.put_many([(message_id, data)], kind)
+    
+    def put_many(self, items: Iterable[Tuple[str, Dict[str, Any]]], kind: str) -> None:
+        """
+        여러 응답을 한 트랜잭션으로 캐시에 저장합니다.
+        
+        Args:
+            items: (메시지 ID, Gmail API 응답) 쌍
+            kind: 응답 종류 ("metadata" 또는 "full")
+        """
+        now = int(time.time())
+        rows = [
+            (message_id, kind, json.dumps(data, ensure_ascii=False), now)
+            for message_id, data in items
+        ]
+        if not rows:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO msg_cache (id, kind, data, fetched_at) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+    
+    def clear(self) -> None:
+        """캐시를 비웁니다."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM msg_cache")
+    
+    def close(self) -> None:
+        """데이터베이스 연결을 닫습니다."""
+        with self._lock:
+            self._conn.close()
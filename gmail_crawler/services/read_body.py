@@ -2,129 +2,342 @@
 이메일 본문 추출 모듈
 Gmail API에서 이메일 내용을 추출하고 파싱합니다.
 """
-import base64
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Iterable, Iterator, List, Optional, Dict, Any, Tuple
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
+from googleapiclient.errors import BatchError, HttpError
+from googleapiclient.http import build_http
 
 try:
-    from bs4 import BeautifulSoup  # pip install beautifulsoup4
+    from pybase64 import urlsafe_b64decode  # SIMD 기반 base64 디코더
 except ImportError:
-    BeautifulSoup = None
+    from base64 import urlsafe_b64decode
+
+try:
+    from lxml import etree, html as lxml_html  # pip install lxml
+except ImportError:
+    etree = None
+    lxml_html = None
 
 from ..utils.exceptions import EmailNotFoundError, EmailExtractionError, TableExtractionError
-from ..utils.logger import LoggerMixin
+from ..utils.logger import LoggerMixin, get_logger
+from ..utils.utils import parse_date_from_subject
 from ..models.models import EmailData
+from .message_cache import MessageCache
 
-class EmailExtractor(LoggerMixin):
-    """이메일 내용 추출을 담당하는 클래스"""
+# 테이블 추출 정규식 (중첩되거나 닫히지 않은 테이블이 없을 때, 또는 lxml이 없을 때 사용)
+_TABLE_RE = re.compile(r"<table\b.*?</table>", re.IGNORECASE | re.DOTALL)
+_TABLE_OPEN_RE = re.compile(r"<table\b", re.IGNORECASE)
+# 주석(Outlook 조건부 주석 포함)과 script/style 안의 테이블은 파서가 무시하므로 정규식에서도 제외
+_COMMENT_RE = re.compile(r"<!--.*?-->", re.DOTALL)
+_RAW_TEXT_BLOCK_RE = re.compile(r"<(script|style)\b.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+_RAW_TEXT_RE = re.compile(r"<(?:script|style)\b", re.IGNORECASE)
+# lxml은 인코딩 선언이 있는 유니코드 문자열을 파싱하지 못하므로 XML 선언을 제거
+_XML_DECL_RE = re.compile(r"^\s*<\?xml\b[^>]*\?>", re.IGNORECASE)
+
+# 본문 조회 시 받을 필드 (헤더, 첨부파일 메타데이터 등 사용하지 않는 필드 제외)
+_PAYLOAD_FIELDS = (
+    "payload(mimeType,body(data,attachmentId),"
+    "parts(mimeType,body(data,attachmentId),parts))"
+)
+
+# Gmail API 배치 요청 하나에 담을 수 있는 최대 하위 요청 수
+_BATCH_LIMIT = 100
+
+# 동시에 실행할 최대 요청 수 (Gmail 사용자별 QPS 한도 고려)
+_MAX_CONCURRENCY = 10
+
+# 개별 요청 재시도 횟수 (429/5xx 응답에 대해 지수 백오프)
+_NUM_RETRIES = 3
+
+# 본문을 찾을 때 방문하지 않는 MIME 주 타입 (첨부파일)
+_SKIPPED_MAJOR_TYPES = frozenset({"image", "application", "audio", "video"})
+
+# 재시도할 HTTP 상태 코드
+_RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+
+
+def _is_retryable(exception: Exception) -> bool:
+    """일시적인 오류(429, 5xx)인지 확인합니다."""
+    return isinstance(exception, HttpError) and exception.status_code in _RETRYABLE_STATUS
+
+
+class HeaderView:
+    """
+    Gmail API 헤더 목록을 이름으로 조회하는 읽기 전용 뷰
     
-    def __init__(self, service: build):
-        self.service = service
+    헤더 목록은 처음 조회할 때 한 번만 색인하며, 헤더 이름은 대소문자를 구분하지 않습니다.
+    같은 이름의 헤더가 여러 개면 마지막 값을 사용합니다.
+    """
     
-    def decode_part(self, data: str) -> str:
+    __slots__ = ("_raw", "_index")
+    
+    def __init__(self, headers: List[Dict[str, str]]):
         """
-        Gmail API의 base64url 인코딩된 데이터를 디코딩합니다.
-        
         Args:
-            data: base64url 인코딩된 데이터
-            
-        Returns:
-            디코딩된 문자열
+            headers: 메시지 페이로드의 headers 목록 ({"name": ..., "value": ...})
         """
-        if not data:
-            return ""
-        try:
-            return base64.urlsafe_b64decode(data.encode("utf-8")).decode("utf-8", errors="ignore")
-        except Exception as e:
-            self.logger.warning(f"데이터 디코딩 실패: {e}")
-            return ""
+        self._raw = headers
+        self._index: Optional[Dict[str, str]] = None
     
-    def extract_html(self, payload: Dict[str, Any]) -> str:
+    @classmethod
+    def from_message(cls, message: Dict[str, Any]) -> "HeaderView":
+        """메시지 응답의 payload.headers로 뷰를 만듭니다."""
+        return cls(message.get("payload", {}).get("headers", []))
+    
+    def get(self, name: str, default: str = "") -> str:
         """
-        멀티파트 구조를 순회하며 text/html을 추출합니다.
+        헤더 값을 반환합니다.
         
         Args:
-            payload: Gmail API 메시지 페이로드
+            name: 헤더 이름 (대소문자 무시)
+            default: 헤더가 없을 때 반환할 값
             
         Returns:
-            HTML 내용
+            헤더 값 또는 default
         """
-        mime_type = payload.get("mimeType", "")
-        body_data = payload.get("body", {}).get("data")
-        parts = payload.get("parts")
+        if self._index is None:
+            self._index = {h["name"].lower(): h["value"] for h in self._raw}
+        return self._index.get(name.lower(), default)
+    
+    def __getitem__(self, name: str) -> str:
+        return self.get(name)
+
+
+# 서비스 객체가 필요 없는 본문 처리 함수들 (EmailExtractor와 같은 로거 사용)
+logger = get_logger("EmailExtractor")
+
+
+def decode_part(data: str) -> str:
+    """
+    Gmail API의 base64url 인코딩된 데이터를 디코딩합니다.
+    
+    Args:
+        data: base64url 인코딩된 데이터
+        
+    Returns:
+        디코딩된 문자열
+    """
+    if not data:
+        return ""
+    try:
+        # base64url 문자열은 ASCII이므로 인코딩 없이 그대로 전달
+        return urlsafe_b64decode(data).decode("utf-8", errors="ignore")
+    except Exception as e:
+        logger.warning("데이터 디코딩 실패: %s", e)
+        return ""
 
-        if mime_type == "text/html" and body_data:
-            return self.decode_part(body_data)
 
+def _iter_parts(payload: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """
+    멀티파트 구조를 재귀 없이 순회합니다.
+    
+    스택을 사용해 재귀 호출과 같은 순서(깊이 우선, 앞쪽 파트 우선)로 방문하며,
+    본문 데이터가 있는 text/* 파트의 하위 파트와 첨부파일 파트는 방문하지 않습니다.
+    
+    Args:
+        payload: Gmail API 메시지 페이로드
+        
+    Yields:
+        메시지 파트
+    """
+    stack = [payload]
+    while stack:
+        part = stack.pop()
+        yield part
+        
+        if part.get("body", {}).get("data") and part.get("mimeType", "").startswith("text/"):
+            continue
+        
+        parts = part.get("parts")
         if parts:
-            for part in parts:
-                html = self.extract_html(part)
-                if html:
-                    return html
+            # 첨부파일(이미지, 문서 등)은 본문이 아니므로 방문하지 않음
+            stack.extend(
+                p for p in reversed(parts)
+                if p.get("mimeType", "").partition("/")[0] not in _SKIPPED_MAJOR_TYPES
+            )
+
+
+def _walk_payload(payload: Dict[str, Any]) -> Iterator[Tuple[str, str]]:
+    """
+    멀티파트 구조를 순회하며 본문 데이터가 있는 파트를 찾습니다.
+    
+    Args:
+        payload: Gmail API 메시지 페이로드
+        
+    Yields:
+        (MIME 타입, base64url 인코딩된 데이터)
+    """
+    for part in _iter_parts(payload):
+        body_data = part.get("body", {}).get("data")
+        if body_data:
+            yield part.get("mimeType", ""), body_data
+
+
+def extract_html(payload: Dict[str, Any]) -> str:
+    """
+    멀티파트 구조를 순회하며 text/html을 추출합니다.
+    
+    Args:
+        payload: Gmail API 메시지 페이로드
+        
+    Returns:
+        HTML 내용
+    """
+    for mime_type, body_data in _walk_payload(payload):
+        if mime_type == "text/html":
+            html = decode_part(body_data)
+            if html:
+                return html
+    return ""
+
+
+def extract_tables_only(html: str) -> str:
+    """
+    HTML에서 테이블만 추출합니다.
+    
+    Args:
+        html: HTML 내용
+        
+    Returns:
+        추출된 테이블 HTML
+        
+    Raises:
+        TableExtractionError: 테이블 추출 실패 시
+    """
+    if not html:
         return ""
     
-    def extract_tables_only(self, html: str) -> str:
-        """
-        HTML에서 테이블만 추출합니다.
+    try:
+        if "<!--" in html:
+            html = _COMMENT_RE.sub("", html)
+        html = _RAW_TEXT_BLOCK_RE.sub("", html)
         
-        Args:
-            html: HTML 내용
-            
-        Returns:
-            추출된 테이블 HTML
-            
-        Raises:
-            TableExtractionError: 테이블 추출 실패 시
-        """
-        if not html:
-            return ""
+        # 1) 정규식: 모든 <table> 태그가 각각 하나의 매치로 닫히면(중첩·미종료 없음)
+        #    HTML 전체를 파싱하지 않고 원본 그대로 사용
+        #    (닫히지 않은 script/style이 남아 있으면 파서에 맡김)
+        tables = _TABLE_RE.findall(html)
+        if lxml_html is None or (
+            len(tables) == len(_TABLE_OPEN_RE.findall(html)) and not _RAW_TEXT_RE.search(html)
+        ):
+            return "\n".join(tables)
         
+        # 2) 중첩되거나 닫히지 않은 테이블은 lxml로 파싱하여 처리
         try:
-            # 1) BeautifulSoup 사용 (권장)
-            if BeautifulSoup is not None:
-                soup = BeautifulSoup(html, "html.parser")
-                tables = soup.find_all("table")
-                if tables:
-                    return "\n".join(str(t) for t in tables)
-                return ""
-            
-            # 2) 폴백: 정규식
-            tables = re.findall(r"(?is)<table\b.*?</table>", html)
-            return "\n".join(tables)
-            
-        except Exception as e:
-            self.logger.error(f"테이블 추출 실패: {e}")
-            raise TableExtractionError(f"테이블 추출 실패: {e}")
+            tree = lxml_html.fromstring(_XML_DECL_RE.sub("", html, count=1))
+        except etree.ParserError:
+            # 주석 등만 있어 파싱할 요소가 없는 문서
+            return ""
+        return "\n".join(
+            lxml_html.tostring(t, encoding="unicode", with_tail=False) for t in tree.iter("table")
+        )
+        
+    except Exception as e:
+        logger.error(f"테이블 추출 실패: {e}")
+        raise TableExtractionError(f"테이블 추출 실패: {e}")
+
+
+def extract_text(payload: Dict[str, Any]) -> str:
+    """
+    멀티파트 구조를 순회하며 텍스트를 추출합니다.
     
-    def extract_text(self, payload: Dict[str, Any]) -> str:
+    Args:
+        payload: Gmail API 메시지 페이로드
+        
+    Returns:
+        텍스트 내용
+    """
+    return extract_bodies(payload)[1]
+
+
+def extract_bodies(payload: Dict[str, Any]) -> Tuple[str, str]:
+    """
+    멀티파트 구조를 한 번만 순회하며 HTML과 텍스트를 함께 추출합니다.
+    
+    Args:
+        payload: Gmail API 메시지 페이로드
+        
+    Returns:
+        (첫 번째 text/html 내용, 모든 text/* 파트를 이어 붙인 텍스트)
+    """
+    html = ""
+    texts = []
+    for mime_type, body_data in _walk_payload(payload):
+        if not mime_type.startswith("text/"):
+            continue
+        text = decode_part(body_data)
+        if not text:
+            continue
+        if not html and mime_type == "text/html":
+            html = text
+        texts.append(text)
+    return html, "\n".join(texts)
+
+
+class EmailExtractor(LoggerMixin):
+    """이메일 내용 추출을 담당하는 클래스"""
+    
+    def __init__(self, service: build, cache: Optional[MessageCache] = None):
+        """
+        Args:
+            service: Gmail API 서비스 객체
+            cache: 메시지 응답 캐시 (None이면 캐시를 사용하지 않음)
         """
-        멀티파트 구조를 순회하며 텍스트를 추출합니다.
+        self.service = service
+        self.cache = cache
+        self._local = threading.local()
+    
+    def decode_part(self, data: str) -> str:
+        """Gmail API의 base64url 인코딩된 데이터를 디코딩합니다. (decode_part 참고)"""
+        return decode_part(data)
+    
+    def _html_attachment_part(self, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        본문 데이터 대신 첨부파일 ID로만 제공된 text/html 파트를 찾습니다.
+        
+        본문에 포함된 text/html 파트가 있으면 추가 조회가 필요 없으므로 None을 반환합니다.
         
         Args:
             payload: Gmail API 메시지 페이로드
             
         Returns:
-            텍스트 내용
+            첨부파일로 제공된 첫 번째 text/html 파트 또는 None
         """
-        mime_type = payload.get("mimeType", "")
-        body_data = payload.get("body", {}).get("data")
-        parts = payload.get("parts")
-
-        if mime_type.startswith("text/") and body_data:
-            return self.decode_part(body_data)
-
-        if parts:
-            texts = []
-            for part in parts:
-                text = self.extract_text(part)
-                if text:
-                    texts.append(text)
-            return "\n".join(texts)
-        return ""
+        candidate = None
+        for part in _iter_parts(payload):
+            if part.get("mimeType") != "text/html":
+                continue
+            body = part.get("body", {})
+            if body.get("data"):
+                return None
+            if candidate is None and body.get("attachmentId"):
+                candidate = part
+        return candidate
+    
+    def extract_html(self, payload: Dict[str, Any]) -> str:
+        """멀티파트 구조를 순회하며 text/html을 추출합니다. (extract_html 참고)"""
+        return extract_html(payload)
+    
+    def extract_tables_only(self, html: str) -> str:
+        """HTML에서 테이블만 추출합니다. (extract_tables_only 참고)"""
+        return extract_tables_only(html)
+    
+    def extract_text(self, payload: Dict[str, Any]) -> str:
+        """멀티파트 구조를 순회하며 텍스트를 추출합니다. (extract_text 참고)"""
+        return extract_text(payload)
+    
+    def extract_bodies(self, payload: Dict[str, Any]) -> Tuple[str, str]:
+        """멀티파트 구조를 한 번만 순회하며 HTML과 텍스트를 함께 추출합니다. (extract_bodies 참고)"""
+        return extract_bodies(payload)
     
-    def list_messages_from_sender(self, sender: str, max_results: int = 10) -> List[Dict[str, Any]]:
+    def list_messages_from_sender(
+        self, sender: str, max_results: int = 10, extra_query: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
         """
         특정 발신자로부터 온 메시지 목록을 가져옵니다.
         발신자는 이름 또는 이메일 주소일 수 있습니다.
@@ -132,9 +345,10 @@ class EmailExtractor(LoggerMixin):
         Args:
             sender: 발신자 이름 또는 이메일 주소
             max_results: 최대 결과 수
+            extra_query: 검색 쿼리에 덧붙일 Gmail 검색 조건 (예: "after:2025/09/01 before:2025/09/05")
             
         Returns:
-            메시지 데이터 목록 (ID, 제목, 날짜 포함)
+            메시지 데이터 목록 (ID, 제목, 날짜, 제목에서 추출한 날짜(parsed_date) 포함)
             
         Raises:
             EmailNotFoundError: 메시지를 찾을 수 없을 때
@@ -152,6 +366,9 @@ class EmailExtractor(LoggerMixin):
                 query = f'from:"{sender}"'
                 self.logger.info(f'이름으로 검색: {sender}')
             
+            if extra_query:
+                query = f"{query} {extra_query}"
+            
             response = self.service.users().messages().list(
                 userId="me", q=query, maxResults=max_results
             ).execute()
@@ -161,44 +378,43 @@ class EmailExtractor(LoggerMixin):
                 self.logger.warning(f'"{sender}"로부터 온 메일 없음')
                 raise EmailNotFoundError(f'"{sender}"로부터 온 메일이 없습니다')
             
+            metadata_by_id = self._get_messages([msg["id"] for msg in messages], "metadata")
+            
             results = []
+            sender_folded = sender.casefold()  # 이메일 주소 비교용 (대소문자 무시)
             self.logger.info(f'"{sender}"로부터 온 메일 목록:')
             
             for msg in messages:
                 msg_id = msg["id"]
-                msg_data = self.service.users().messages().get(
-                    userId="me", 
-                    id=msg_id, 
-                    format="metadata", 
-                    metadataHeaders=["From", "Subject", "Date"]
-                ).execute()
+                msg_data = metadata_by_id[msg_id]
                 
-                headers = msg_data.get("payload", {}).get("headers", [])
-                header_dict = {h["name"]: h["value"] for h in headers}
-                from_val = header_dict.get("From", "")
-                subject_val = header_dict.get("Subject", "")
-                date_val = header_dict.get("Date", "")
+                headers = HeaderView.from_message(msg_data)
+                from_val = headers["From"]
+                subject_val = headers["Subject"]
+                date_val = headers["Date"]
                 
                 # 이메일 주소로 검색한 경우 정확한 매칭, 이름으로 검색한 경우 부분 매칭
                 if is_email:
                     # 이메일 주소가 From 헤더에 포함되어 있는지 확인
-                    if sender.lower() in from_val.lower():
-                        self.logger.info(f"Date: {date_val}, From: {from_val}, Subject: {subject_val}, ID: {msg_id}")
+                    if sender_folded in from_val.casefold():
+                        self.logger.info("Date: %s, From: %s, Subject: %s, ID: %s", date_val, from_val, subject_val, msg_id)
                         results.append({
                             "id": msg_id,
                             "subject": subject_val,
                             "date": date_val,
-                            "from": from_val
+                            "from": from_val,
+                            "parsed_date": parse_date_from_subject(subject_val)
                         })
                 else:
                     # 이름이 From 헤더에 포함되어 있는지 확인
                     if sender in from_val:
-                        self.logger.info(f"Date: {date_val}, From: {from_val}, Subject: {subject_val}, ID: {msg_id}")
+                        self.logger.info("Date: %s, From: %s, Subject: %s, ID: %s", date_val, from_val, subject_val, msg_id)
                         results.append({
                             "id": msg_id,
                             "subject": subject_val,
                             "date": date_val,
-                            "from": from_val
+                            "from": from_val,
+                            "parsed_date": parse_date_from_subject(subject_val)
                         })
             
             return results
@@ -207,6 +423,254 @@ class EmailExtractor(LoggerMixin):
             self.logger.error(f"메시지 목록 조회 실패: {e}")
             raise EmailNotFoundError(f"메시지 목록 조회 실패: {e}")
     
+    def _request(self, message_id: str, kind: str):
+        """응답 종류("metadata" 또는 "full")에 맞는 메시지 조회 요청을 만듭니다."""
+        if kind == "metadata":
+            return self._metadata_request(message_id)
+        return self._full_request(message_id)
+    
+    def _get_message(self, message_id: str, kind: str) -> Dict[str, Any]:
+        """
+        메시지 하나를 가져옵니다. 캐시가 있으면 먼저 조회합니다.
+        
+        Args:
+            message_id: 메시지 ID
+            kind: 응답 종류 ("metadata" 또는 "full")
+            
+        Returns:
+            Gmail API 응답
+        """
+        if self.cache is not None:
+            cached = self.cache.get(message_id, kind)
+            if cached is not None:
+                return cached
+        
+        response = self._request(message_id, kind).execute()
+        if kind == "full":
+            self._fetch_html_attachments({message_id: response})
+        if self.cache is not None:
+            self.cache.put(message_id, kind, response)
+        return response
+    
+    def _get_messages(self, message_ids: List[str], kind: str) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 메시지를 가져옵니다. 캐시에 없는 메시지만 배치 요청으로 조회합니다.
+        
+        Args:
+            message_ids: 메시지 ID 목록
+            kind: 응답 종류 ("metadata" 또는 "full")
+            
+        Returns:
+            메시지 ID별 Gmail API 응답
+        """
+        found = self.cache.get_many(message_ids, kind) if self.cache is not None else {}
+        missing = [msg_id for msg_id in dict.fromkeys(message_ids) if msg_id not in found]
+        if found:
+            self.logger.info(f"캐시된 메시지 {len(found)}개 사용, {len(missing)}개 조회")
+        
+        if missing:
+            fetched = self._batch_get((msg_id, self._request(msg_id, kind)) for msg_id in missing)
+            if kind == "full":
+                self._fetch_html_attachments(fetched)
+            if self.cache is not None:
+                self.cache.put_many(fetched.items(), kind)
+            found.update(fetched)
+        return found
+    
+    def _metadata_request(self, message_id: str):
+        """메시지 메타데이터(From, Subject, Date) 조회 요청을 만듭니다."""
+        return self.service.users().messages().get(
+            userId="me", 
+            id=message_id, 
+            format="metadata", 
+            metadataHeaders=["From", "Subject", "Date"]
+        )
+    
+    def _full_request(self, message_id: str):
+        """본문 추출에 필요한 필드(MIME 타입, 본문 데이터)만 포함한 메시지 조회 요청을 만듭니다."""
+        return self.service.users().messages().get(
+            userId="me", id=message_id, format="full", fields=_PAYLOAD_FIELDS
+        )
+    
+    def _fetch_html_attachments(self, responses: Dict[str, Dict[str, Any]]) -> None:
+        """
+        HTML 본문이 첨부파일로만 제공된 메시지의 본문 데이터를 조회하여 채워 넣습니다.
+        
+        Args:
+            responses: 메시지 ID별 본문 조회 응답 (제자리에서 수정됨)
+        """
+        pending = {}
+        for msg_id, response in responses.items():
+            part = self._html_attachment_part(response.get("payload", {}))
+            if part is not None:
+                pending[msg_id] = part
+        if not pending:
+            return
+        
+        self.logger.info(f"첨부파일로 제공된 HTML 본문 {len(pending)}개 조회")
+        attachments = self._batch_get(
+            (
+                msg_id,
+                self.service.users().messages().attachments().get(
+                    userId="me", messageId=msg_id, id=part["body"]["attachmentId"]
+                ),
+            )
+            for msg_id, part in pending.items()
+        )
+        for msg_id, part in pending.items():
+            part["body"]["data"] = attachments[msg_id].get("data", "")
+    
+    def _batch_get(self, requests: Iterable[Tuple[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 Gmail API 요청을 BatchHttpRequest로 묶어 실행합니다.
+        
+        Gmail 배치 요청 한도(100개)에 맞춰 나누어 실행하므로 N개의 요청이
+        약 N/100번의 HTTP 왕복으로 처리되며, 배치가 여러 개면 동시에 실행합니다.
+        
+        Args:
+            requests: (요청 ID, HttpRequest) 쌍
+            
+        Returns:
+            요청 ID별 응답
+            
+        Raises:
+            EmailExtractionError: 하위 요청이 하나라도 실패했을 때
+        """
+        requests = iter(requests)
+        chunks = []
+        while chunk := list(islice(requests, _BATCH_LIMIT)):
+            chunks.append(chunk)
+        
+        if len(chunks) <= 1:
+            outcomes = [self._execute_chunk(chunk) for chunk in chunks]
+        else:
+            # httplib2.Http는 스레드 안전하지 않으므로 스레드마다 별도의 연결을 사용
+            with ThreadPoolExecutor(max_workers=min(_MAX_CONCURRENCY, len(chunks))) as executor:
+                outcomes = list(executor.map(
+                    lambda chunk: self._execute_chunk(chunk, self._thread_http()), chunks
+                ))
+        
+        responses: Dict[str, Dict[str, Any]] = {}
+        for chunk_responses, chunk_errors in outcomes:
+            if chunk_errors:
+                request_id, exception = next(iter(chunk_errors.items()))
+                raise EmailExtractionError(f"배치 요청 실패 ({request_id}): {exception}")
+            responses.update(chunk_responses)
+        return responses
+    
+    def _execute_chunk(
+        self, chunk: List[Tuple[str, Any]], http: Any = None
+    ) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Exception]]:
+        """
+        요청 묶음 하나를 배치로 실행합니다.
+        
+        배치 요청 자체가 실패하거나 하위 요청이 일시적인 오류(429, 5xx)로 실패하면
+        해당 요청들을 개별 요청(재시도 포함)으로 다시 실행합니다.
+        
+        Args:
+            chunk: (요청 ID, HttpRequest) 쌍 목록 (최대 100개)
+            http: 사용할 HTTP 객체 (None이면 서비스 기본값)
+            
+        Returns:
+            (요청 ID별 응답, 요청 ID별 예외)
+        """
+        responses: Dict[str, Dict[str, Any]] = {}
+        errors: Dict[str, Exception] = {}
+        
+        def callback(request_id: str, response: Dict[str, Any], exception: Optional[Exception]) -> None:
+            if exception is not None:
+                errors[request_id] = exception
+            else:
+                responses[request_id] = response
+        
+        batch = self.service.new_batch_http_request(callback=callback)
+        for request_id, request in chunk:
+            batch.add(request, request_id=request_id)
+        
+        try:
+            batch.execute(http=http)
+            retry = [
+                (request_id, request) for request_id, request in chunk
+                if request_id in errors and _is_retryable(errors[request_id])
+            ]
+        except (HttpError, BatchError) as e:
+            self.logger.warning(f"배치 요청 실패, 개별 요청으로 재시도합니다: {e}")
+            retry = [(request_id, request) for request_id, request in chunk if request_id not in responses]
+        
+        if retry:
+            self.logger.info(f"{len(retry)}개 요청을 개별적으로 재시도합니다")
+            retry_responses, retry_errors = self._execute_individually(retry)
+            for request_id, _ in retry:
+                errors.pop(request_id, None)
+            responses.update(retry_responses)
+            errors.update(retry_errors)
+        
+        return responses, errors
+    
+    def _execute_individually(
+        self, requests: List[Tuple[str, Any]]
+    ) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Exception]]:
+        """
+        요청들을 개별적으로 동시에 실행합니다. 429/5xx 응답은 지수 백오프로 재시도합니다.
+        
+        Args:
+            requests: (요청 ID, HttpRequest) 쌍 목록
+            
+        Returns:
+            (요청 ID별 응답, 요청 ID별 예외)
+        """
+        def execute(request: Any) -> Dict[str, Any]:
+            return request.execute(http=self._thread_http(), num_retries=_NUM_RETRIES)
+        
+        responses: Dict[str, Dict[str, Any]] = {}
+        errors: Dict[str, Exception] = {}
+        with ThreadPoolExecutor(max_workers=min(_MAX_CONCURRENCY, len(requests))) as executor:
+            futures = {executor.submit(execute, request): request_id for request_id, request in requests}
+            for future in as_completed(futures):
+                request_id = futures[future]
+                try:
+                    responses[request_id] = future.result()
+                except Exception as e:
+                    errors[request_id] = e
+        return responses, errors
+    
+    def _thread_http(self) -> Optional[AuthorizedHttp]:
+        """
+        현재 스레드 전용 HTTP 객체를 반환합니다.
+        
+        서비스가 httplib2 기반 인증 HTTP 객체를 사용하지 않으면 None을 반환하여
+        서비스 기본값을 사용하게 합니다. requests 세션 기반 전송(RequestsHttp)은
+        연결 풀을 스레드 간에 공유할 수 있으므로 스레드별 객체가 필요 없습니다.
+        """
+        http = getattr(self._local, "http", None)
+        if http is None:
+            base = getattr(self.service, "_http", None)
+            if not isinstance(base, AuthorizedHttp):
+                return None
+            http = AuthorizedHttp(base.credentials, http=build_http())
+            self._local.http = http
+        return http
+    
+    def _build_email_data(
+        self, message_id: str, msg_metadata: Dict[str, Any], msg_full: Dict[str, Any]
+    ) -> EmailData:
+        """메타데이터와 전체 메시지 응답으로 이메일 데이터를 만듭니다."""
+        headers = HeaderView.from_message(msg_metadata)
+        
+        # HTML과 텍스트 추출 (페이로드를 한 번만 순회)
+        html_content, text_content = extract_bodies(msg_full["payload"])
+        tables_html = extract_tables_only(html_content) if html_content else ""
+        
+        return EmailData(
+            message_id=message_id,
+            sender=headers["From"],
+            subject=headers["Subject"],
+            date=headers["Date"],
+            html_content=html_content,
+            text_content=text_content,
+            tables_html=tables_html
+        )
+    
     def get_email_data(self, message_id: str) -> EmailData:
         """
         특정 메시지의 이메일 데이터를 가져옵니다.
@@ -222,72 +686,57 @@ class EmailExtractor(LoggerMixin):
         """
         try:
             # 메시지 메타데이터 가져오기
-            msg_metadata = self.service.users().messages().get(
-                userId="me", 
-                id=message_id, 
-                format="metadata", 
-                metadataHeaders=["From", "Subject", "Date"]
-            ).execute()
-            
-            headers = msg_metadata.get("payload", {}).get("headers", [])
-            header_dict = {h["name"]: h["value"] for h in headers}
+            msg_metadata = self._get_message(message_id, "metadata")
             
             # 전체 메시지 가져오기
-            msg_full = self.service.users().messages().get(
-                userId="me", id=message_id, format="full"
-            ).execute()
-            
-            # HTML과 텍스트 추출
-            html_content = self.extract_html(msg_full["payload"])
-            text_content = self.extract_text(msg_full["payload"])
-            tables_html = self.extract_tables_only(html_content) if html_content else ""
+            msg_full = self._get_message(message_id, "full")
             
-            return EmailData(
-                message_id=message_id,
-                sender=header_dict.get("From", ""),
-                subject=header_dict.get("Subject", ""),
-                date=header_dict.get("Date", ""),
-                html_content=html_content,
-                text_content=text_content,
-                tables_html=tables_html
-            )
+            return self._build_email_data(message_id, msg_metadata, msg_full)
             
         except Exception as e:
             self.logger.error(f"이메일 데이터 추출 실패: {e}")
             raise EmailExtractionError(f"이메일 데이터 추출 실패: {e}")
+    
+    def get_email_data_batch(self, message_ids: List[str]) -> List[EmailData]:
+        """
+        여러 메시지의 이메일 데이터를 배치 요청으로 가져옵니다.
+        
+        Args:
+            message_ids: 메시지 ID 목록
+            
+        Returns:
+            이메일 데이터 목록 (message_ids와 같은 순서)
+            
+        Raises:
+            EmailExtractionError: 이메일 추출 실패 시
+        """
+        try:
+            metadata_by_id = self._get_messages(message_ids, "metadata")
+            full_by_id = self._get_messages(message_ids, "full")
+            
+            return [
+                self._build_email_data(msg_id, metadata_by_id[msg_id], full_by_id[msg_id])
+                for msg_id in message_ids
+            ]
+            
+        except Exception as e:
+            self.logger.error(f"이메일 데이터 배치 추출 실패: {e}")
+            raise EmailExtractionError(f"이메일 데이터 배치 추출 실패: {e}")
 
 
 # 하위 호환성을 위한 함수들
-def decode_part(data: str) -> str:
-    """하위 호환성을 위한 함수"""
-    extractor = EmailExtractor(None)  # type: ignore
-    return extractor.decode_part(data)
-
-def extract_html(payload: Dict[str, Any]) -> str:
-    """하위 호환성을 위한 함수"""
-    extractor = EmailExtractor(None)  # type: ignore
-    return extractor.extract_html(payload)
-
-def extract_tables_only(html: str) -> str:
-    """하위 호환성을 위한 함수"""
-    extractor = EmailExtractor(None)  # type: ignore
-    return extractor.extract_tables_only(html)
-
-def extract_text(payload: Dict[str, Any]) -> str:
-    """하위 호환성을 위한 함수"""
-    extractor = EmailExtractor(None)  # type: ignore
-    return extractor.extract_text(payload)
-
 def list_messages_from_name(service: build, name: str, max_results: int = 10) -> List[str]:
     """하위 호환성을 위한 함수 (deprecated: list_messages_from_sender 사용 권장)"""
     extractor = EmailExtractor(service)
     messages_data = extractor.list_messages_from_sender(name, max_results)
     return [msg['id'] for msg in messages_data]
 
-def list_messages_from_sender(service: build, sender: str, max_results: int = 10) -> List[Dict[str, Any]]:
+def list_messages_from_sender(
+    service: build, sender: str, max_results: int = 10, extra_query: Optional[str] = None
+) -> List[Dict[str, Any]]:
     """하위 호환성을 위한 함수"""
     extractor = EmailExtractor(service)
-    return extractor.list_messages_from_sender(sender, max_results)
+    return extractor.list_messages_from_sender(sender, max_results, extra_query)
 
 def main():
     """하위 호환성을 위한 메인 함수"""
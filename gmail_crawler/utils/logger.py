@@ -61,9 +61,15 @@ def get_logger(name: str) -> logging.Logger:
 
 
 class LoggerMixin:
-    """로깅 기능을 제공하는 믹스인 클래스"""
+    """
+    로깅 기능을 제공하는 믹스인 클래스
+    
+    하위 클래스가 정의될 때 클래스 이름의 로거를 클래스 속성으로 한 번만 가져오므로
+    self.logger 접근 시 logging 모듈의 잠금과 조회가 발생하지 않습니다.
+    """
+    
+    logger: logging.Logger
     
-    @property
-    def logger(self) -> logging.Logger:
-        """클래스별 로거를 반환합니다."""
-        return get_logger(self.__class__.__name__)
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.logger = get_logger(cls.__name__)
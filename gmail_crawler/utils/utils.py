@@ -4,10 +4,60 @@
 """
 from pathlib import Path
 from typing import Optional, List, Dict, Any
+import asyncio
+import functools
 import json
-from datetime import datetime
+import os
+import re
+from datetime import date, datetime, timedelta
 from .exceptions import FileProcessingError, ValidationError
 
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json 사용
+    orjson = None
+
+# 텍스트 변환 없이 새로 쓰기 위한 플래그 (Windows에서는 O_BINARY 필요)
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+# 파일명에 사용할 수 없는 문자 → 언더스코어 변환 테이블
+_UNSAFE_FILENAME_TABLE = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+_UNDERSCORES_RE = re.compile(r'_{2,}')
+
+# 제목 날짜 패턴 (우선순위 순)
+_FULL_KOREAN_DATE_RE = re.compile(r'(\d{4})년(\d{1,2})월(\d{1,2})일')  # "2025년09월04일"
+_COMPACT_DATE_RE = re.compile(r'(\d{8})')  # "20250902"
+_MONTH_DAY_RE = re.compile(r'(\d{1,2})월(\d{1,2})일')  # "09월04일" (올해 기준)
+
+# HTML 문서 골격 (본문 앞뒤에 붙이는 고정 문자열)
+_TABLE_HTML_PREFIX = (
+    "<html><head><meta charset='utf-8'>"
+    "<style>table{border-collapse:collapse;} td,th{border:1px solid #ccc;padding:4px;}</style>"
+    "</head><body>"
+)
+_FULL_HTML_PREFIX = "<html><head><meta charset='utf-8'></head><body>"
+_HTML_SUFFIX = "</body></html>"
+
+
+def _write_bytes(file_path: Path, data: bytes) -> None:
+    """
+    바이트를 파일 디스크립터에 직접 기록합니다.
+    
+    os.write는 일부만 기록할 수 있으므로 남은 바이트가 없을 때까지 반복합니다.
+    
+    Args:
+        file_path: 저장할 파일 경로
+        data: 기록할 바이트
+    """
+    fd = os.open(file_path, _WRITE_FLAGS, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
 
 def save_html_file(content: str, filename: str, output_dir: Path) -> Path:
     """
@@ -28,8 +78,8 @@ def save_html_file(content: str, filename: str, output_dir: Path) -> Path:
         output_dir.mkdir(exist_ok=True)
         file_path = output_dir / filename
         
-        with file_path.open("w", encoding="utf-8") as f:
-            f.write(content)
+        # 한 번만 인코딩하고 파일 객체의 버퍼링 없이 바로 기록
+        _write_bytes(file_path, content.encode("utf-8"))
         
         return file_path
     except Exception as e:
@@ -46,13 +96,8 @@ def create_table_html(tables_html: str) -> str:
     Returns:
         완전한 HTML 문서
     """
-    return (
-        "<html><head><meta charset='utf-8'>"
-        "<style>table{border-collapse:collapse;} td,th{border:1px solid #ccc;padding:4px;}</style>"
-        "</head><body>"
-        + tables_html +
-        "</body></html>"
-    )
+    # 큰 본문을 중간 문자열 없이 한 번에 이어 붙임
+    return "".join((_TABLE_HTML_PREFIX, tables_html, _HTML_SUFFIX))
 
 
 def create_full_html(html_content: str) -> str:
@@ -65,7 +110,7 @@ def create_full_html(html_content: str) -> str:
     Returns:
         완전한 HTML 문서
     """
-    return f"<html><head><meta charset='utf-8'></head><body>{html_content}</body></html>"
+    return "".join((_FULL_HTML_PREFIX, html_content, _HTML_SUFFIX))
 
 
 def save_json_file(data: Dict[str, Any], file_path: Path) -> None:
@@ -80,12 +125,71 @@ def save_json_file(data: Dict[str, Any], file_path: Path) -> None:
         FileProcessingError: 파일 저장 실패 시
     """
     try:
-        with file_path.open("w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        if orjson is not None:
+            # orjson은 UTF-8 바이트를 바로 만들므로 인코딩 단계 없이 기록
+            content = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        else:
+            content = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+        _write_bytes(file_path, content)
     except Exception as e:
         raise FileProcessingError(f"JSON 파일 저장 실패: {e}")
 
 
+async def save_html_file_async(content: str, filename: str, output_dir: Path) -> Path:
+    """
+    save_html_file을 작업 스레드에서 실행하여 이벤트 루프를 막지 않고 저장합니다.
+    
+    여러 파일은 asyncio.gather로 동시에 저장할 수 있습니다.
+    
+    Args:
+        content: HTML 내용
+        filename: 파일명
+        output_dir: 출력 디렉토리
+        
+    Returns:
+        저장된 파일 경로
+        
+    Raises:
+        FileProcessingError: 파일 저장 실패 시
+    """
+    return await asyncio.to_thread(save_html_file, content, filename, output_dir)
+
+
+async def save_json_file_async(data: Dict[str, Any], file_path: Path) -> None:
+    """
+    save_json_file을 작업 스레드에서 실행하여 이벤트 루프를 막지 않고 저장합니다.
+    
+    Args:
+        data: 저장할 데이터
+        file_path: 저장할 파일 경로
+        
+    Raises:
+        FileProcessingError: 파일 저장 실패 시
+    """
+    await asyncio.to_thread(save_json_file, data, file_path)
+
+
+def loads_json(data: str | bytes) -> Any:
+    """
+    JSON 문자열(또는 바이트)을 파싱합니다.
+    
+    orjson이 설치되어 있으면 사용하고, 없으면 표준 json 모듈을 사용합니다.
+    
+    Args:
+        data: JSON 문자열 또는 UTF-8 바이트
+        
+    Returns:
+        파싱된 객체
+        
+    Raises:
+        json.JSONDecodeError: JSON 형식이 올바르지 않을 때
+    """
+    if orjson is not None:
+        # orjson.JSONDecodeError는 json.JSONDecodeError의 하위 클래스
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def load_json_file(file_path: Path) -> Dict[str, Any]:
     """
     JSON 파일을 로드합니다.
@@ -100,8 +204,7 @@ def load_json_file(file_path: Path) -> Dict[str, Any]:
         FileProcessingError: 파일 로드 실패 시
     """
     try:
-        with file_path.open("r", encoding="utf-8") as f:
-            return json.load(f)
+        return loads_json(file_path.read_bytes())
     except Exception as e:
         raise FileProcessingError(f"JSON 파일 로드 실패: {e}")
 
@@ -140,16 +243,8 @@ def clean_filename(filename: str) -> str:
     Returns:
         정리된 파일명
     """
-    # 안전하지 않은 문자들을 언더스코어로 대체
-    unsafe_chars = '<>:"/\\|?*'
-    for char in unsafe_chars:
-        filename = filename.replace(char, '_')
-    
-    # 연속된 언더스코어를 하나로 정리
-    while '__' in filename:
-        filename = filename.replace('__', '_')
-    
-    return filename.strip('_')
+    # 안전하지 않은 문자들을 언더스코어로 대체한 뒤 연속된 언더스코어를 하나로 정리
+    return _UNDERSCORES_RE.sub('_', filename.translate(_UNSAFE_FILENAME_TABLE)).strip('_')
 
 
 def ensure_directory_exists(directory: Path) -> None:
@@ -162,68 +257,157 @@ def ensure_directory_exists(directory: Path) -> None:
     directory.mkdir(parents=True, exist_ok=True)
 
 
-def parse_date_from_subject(subject: str) -> Optional[str]:
+def _is_valid_compact_date(date_str: str) -> bool:
     """
-    제목에서 날짜를 추출합니다.
+    8자리 숫자 문자열이 실제 날짜(YYYYMMDD)인지 확인합니다.
+    
+    자릿수가 고정되어 있으므로 strptime의 형식 해석 없이 잘라서 검사합니다.
     
     Args:
-        subject: 이메일 제목
+        date_str: 8자리 숫자 문자열
         
     Returns:
-        추출된 날짜 문자열 (YYYYMMDD 형식) 또는 None
+        유효한 날짜이면 True
+    """
+    try:
+        date(int(date_str[:4]), int(date_str[4:6]), int(date_str[6:]))
+    except ValueError:
+        return False
+    return True
+
+
+@functools.lru_cache(maxsize=1024)
+def _match_subject_date(subject: str) -> Optional[str]:
     """
-    import re
-    from datetime import datetime
+    제목에서 날짜 패턴을 찾습니다.
     
+    같은 제목이 반복해서 파싱되므로 결과를 캐시합니다. 현재 시각에 의존하지 않도록
+    연도가 없는 "MM월DD일" 형식은 연도 없이 "MMDD"로 반환합니다.
+    
+    Args:
+        subject: 이메일 제목
+        
+    Returns:
+        "YYYYMMDD", "MMDD" 또는 None
+    """
     # 패턴 1: "2025년09월04일" 형식
-    pattern1 = r'(\d{4})년(\d{1,2})월(\d{1,2})일'
-    match1 = re.search(pattern1, subject)
+    match1 = _FULL_KOREAN_DATE_RE.search(subject)
     if match1:
         year, month, day = match1.groups()
         return f"{year}{month.zfill(2)}{day.zfill(2)}"
     
     # 패턴 2: "20250902" 형식 (8자리 숫자)
-    pattern2 = r'(\d{8})'
-    match2 = re.search(pattern2, subject)
+    match2 = _COMPACT_DATE_RE.search(subject)
     if match2:
         date_str = match2.group(1)
         # 유효한 날짜인지 확인
-        try:
-            datetime.strptime(date_str, '%Y%m%d')
+        if _is_valid_compact_date(date_str):
             return date_str
-        except ValueError:
-            pass
     
-    # 패턴 3: "09월04일" 형식 (올해 기준)
-    pattern3 = r'(\d{1,2})월(\d{1,2})일'
-    match3 = re.search(pattern3, subject)
+    # 패턴 3: "09월04일" 형식 (연도는 호출 시점에 채움)
+    match3 = _MONTH_DAY_RE.search(subject)
     if match3:
         month, day = match3.groups()
-        current_year = datetime.now().year
-        return f"{current_year}{month.zfill(2)}{day.zfill(2)}"
+        return f"{month.zfill(2)}{day.zfill(2)}"
     
     return None
 
 
-def find_message_by_date(messages_data: List[Dict[str, Any]], target_date: str) -> Optional[Dict[str, Any]]:
+def parse_date_from_subject(subject: str) -> Optional[str]:
+    """
+    제목에서 날짜를 추출합니다.
+    
+    "MM월DD일" 형식은 호출 시점의 연도를 사용합니다.
+    
+    Args:
+        subject: 이메일 제목
+        
+    Returns:
+        추출된 날짜 문자열 (YYYYMMDD 형식) 또는 None
+    """
+    matched = _match_subject_date(subject)
+    if matched is not None and len(matched) == 4:
+        return f"{datetime.now().year}{matched}"
+    return matched
+
+def build_date_query(target_date: str, window_days: int = 3) -> str:
+    """
+    특정 날짜 전후 기간으로 Gmail 검색 조건을 만듭니다.
+    
+    제목의 날짜와 실제 수신 날짜가 다를 수 있으므로 앞뒤로 여유 기간을 둡니다.
+    
+    Args:
+        target_date: 기준 날짜 (YYYYMMDD 형식)
+        window_days: 기준 날짜 앞뒤로 포함할 일수
+        
+    Returns:
+        Gmail 검색 조건 (예: "after:2025/09/01 before:2025/09/08")
+        
+    Raises:
+        ValidationError: 날짜 형식이 올바르지 않을 때
+    """
+    try:
+        day = datetime.strptime(target_date, "%Y%m%d")
+    except ValueError as e:
+        raise ValidationError(f"잘못된 날짜 형식: {target_date}") from e
+    
+    after = day - timedelta(days=window_days)
+    before = day + timedelta(days=window_days + 1)
+    return f"after:{after:%Y/%m/%d} before:{before:%Y/%m/%d}"
+
+
+def _message_date(msg_data: Dict[str, Any]) -> Optional[str]:
+    """
+    메시지의 제목 날짜를 반환합니다.
+    
+    list_messages_from_sender가 미리 추출한 parsed_date가 있으면 그대로 사용하고,
+    없으면 제목에서 추출합니다.
+    """
+    if 'parsed_date' in msg_data:
+        return msg_data['parsed_date']
+    return parse_date_from_subject(msg_data.get('subject', ''))
+
+
+def build_date_index(messages_data: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    제목 날짜별 메시지 색인을 만듭니다.
+    
+    같은 목록에서 여러 날짜를 찾을 때 목록을 한 번만 순회하도록 사용합니다.
+    
+    Args:
+        messages_data: 메시지 데이터 목록 (제목과 날짜 포함)
+        
+    Returns:
+        날짜(YYYYMMDD 형식)별 메시지 데이터 (같은 날짜면 목록에서 먼저 나온 메시지)
+    """
+    index: Dict[str, Dict[str, Any]] = {}
+    for msg_data in messages_data:
+        parsed_date = _message_date(msg_data)
+        if parsed_date:
+            index.setdefault(parsed_date, msg_data)
+    return index
+
+
+def find_message_by_date(
+    messages_data: List[Dict[str, Any]],
+    target_date: str,
+    date_index: Optional[Dict[str, Dict[str, Any]]] = None
+) -> Optional[Dict[str, Any]]:
     """
     메시지 목록에서 특정 날짜의 메시지를 찾습니다.
     
     Args:
         messages_data: 메시지 데이터 목록 (제목과 날짜 포함)
         target_date: 찾을 날짜 (YYYYMMDD 형식)
+        date_index: build_date_index로 만든 색인 (있으면 목록을 순회하지 않음)
         
     Returns:
         해당 날짜의 메시지 데이터 또는 None
     """
-    for msg_data in messages_data:
-        subject = msg_data.get('subject', '')
-        parsed_date = parse_date_from_subject(subject)
-        
-        if parsed_date == target_date:
-            return msg_data
+    if date_index is not None:
+        return date_index.get(target_date)
     
-    return None
+    return next((m for m in messages_data if _message_date(m) == target_date), None)
 
 
 def find_latest_message(messages_data: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
@@ -236,14 +420,9 @@ def find_latest_message(messages_data: List[Dict[str, Any]]) -> Optional[Dict[st
     Returns:
         가장 최신 메시지 데이터 또는 None
     """
-    if not messages_data:
-        return None
-    
-    # 날짜별로 정렬 (최신순)
-    sorted_messages = sorted(
+    # 제목 날짜가 가장 늦은 메시지 (같으면 목록에서 먼저 나온 메시지)
+    return max(
         messages_data,
-        key=lambda x: parse_date_from_subject(x.get('subject', '')) or '00000000',
-        reverse=True
+        key=lambda x: _message_date(x) or '00000000',
+        default=None
     )
-    
-    return sorted_messages[0]
@@ -1,23 +1,20 @@
 """
 pytest 설정 및 공통 픽스처
 """
-import tempfile
-from pathlib import Path
 import pytest
 
 from gmail_crawler.core.config import Config
 
 
 @pytest.fixture
-def temp_config():
+def temp_config(tmp_path):
     """임시 설정 픽스처"""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        config = Config(
-            output_dir=Path(temp_dir) / "output",
-            temp_dir=Path(temp_dir) / "temp"
-        )
-        config.ensure_directories()
-        yield config
+    config = Config(
+        output_dir=tmp_path / "output",
+        temp_dir=tmp_path / "temp"
+    )
+    config.ensure_directories()
+    return config
 
 
 @pytest.fixture
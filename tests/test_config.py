@@ -2,7 +2,6 @@
 설정 모듈 테스트
 """
 import os
-import tempfile
 from pathlib import Path
 import pytest
 
@@ -21,6 +20,12 @@ class TestConfig:
         assert config.temp_dir == Path("temp")
         assert config.device_scale_factor == 2
         assert config.full_page_capture is True
+        assert config.save_html is False
+        assert config.gemini_cache is True
+        assert config.gemini_max_image_width == 1500
+        assert config.gemini_cache_dir == Path("temp") / "gemini_cache"
+        assert config.message_cache is True
+        assert config.message_cache_file == Path("temp") / "msg_cache.sqlite"
     
     def test_from_env(self):
         """환경변수에서 설정 로드 테스트"""
@@ -29,6 +34,7 @@ class TestConfig:
         os.environ["MAX_RESULTS"] = "5"
         os.environ["OUTPUT_DIR"] = "custom_output"
         os.environ["LOG_LEVEL"] = "DEBUG"
+        Config.invalidate_cache()
         
         try:
             config = Config.from_env()
@@ -40,11 +46,13 @@ class TestConfig:
             # 환경변수 정리
             for key in ["SENDER_NAME", "MAX_RESULTS", "OUTPUT_DIR", "LOG_LEVEL"]:
                 os.environ.pop(key, None)
+            Config.invalidate_cache()
     
     def test_from_env_with_email(self):
         """이메일 주소로 설정 로드 테스트"""
         # 환경변수 설정
         os.environ["SENDER_NAME"] = "test@example.com"
+        Config.invalidate_cache()
         
         try:
             config = Config.from_env()
@@ -52,19 +60,52 @@ class TestConfig:
         finally:
             # 환경변수 정리
             os.environ.pop("SENDER_NAME", None)
+            Config.invalidate_cache()
     
-    def test_ensure_directories(self):
-        """디렉토리 생성 테스트"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config = Config(
-                output_dir=Path(temp_dir) / "output",
-                temp_dir=Path(temp_dir) / "temp"
-            )
+    def test_from_env_cached(self):
+        """from_env 캐시 테스트"""
+        Config.invalidate_cache()
+        os.environ["SENDER_NAME"] = "캐시발신자"
+        
+        try:
+            config = Config.from_env()
+            os.environ["SENDER_NAME"] = "변경된발신자"
             
-            config.ensure_directories()
+            # 캐시된 설정이 반환되어야 함
+            assert Config.from_env() is config
+            assert Config.from_env().sender_name == "캐시발신자"
             
-            assert config.output_dir.exists()
-            assert config.temp_dir.exists()
+            # 캐시 무효화 후에는 환경변수를 다시 읽어야 함
+            Config.invalidate_cache()
+            assert Config.from_env().sender_name == "변경된발신자"
+        finally:
+            os.environ.pop("SENDER_NAME", None)
+            Config.invalidate_cache()
+    
+    def test_gemini_cache_disabled(self):
+        """GEMINI_CACHE=false 설정 테스트"""
+        os.environ["GEMINI_CACHE"] = "false"
+        Config.invalidate_cache()
+        
+        try:
+            config = Config.from_env()
+            assert config.gemini_cache is False
+            assert config.gemini_cache_dir is None
+        finally:
+            os.environ.pop("GEMINI_CACHE", None)
+            Config.invalidate_cache()
+    
+    def test_ensure_directories(self, tmp_path):
+        """디렉토리 생성 테스트"""
+        config = Config(
+            output_dir=tmp_path / "output",
+            temp_dir=tmp_path / "temp"
+        )
+        
+        config.ensure_directories()
+        
+        assert config.output_dir.exists()
+        assert config.temp_dir.exists()
     
     def test_validate_success(self):
         """유효한 설정 검증 테스트"""
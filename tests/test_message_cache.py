@@ -0,0 +1,87 @@
+"""
+메시지 캐시 모듈 테스트
+"""
+import sqlite3
+import time
+from unittest.mock import Mock, patch
+import pytest
+
+from gmail_crawler.core.workflow import GmailTableExtractor
+from gmail_crawler.services.message_cache import MessageCache
+from gmail_crawler.services.read_body import EmailExtractor
+
+
+class TestMessageCache:
+    """MessageCache 클래스 테스트"""
+    
+    def test_put_and_get(self, tmp_path):
+        """캐시 저장 및 조회 테스트"""
+        cache = MessageCache(tmp_path / "msg_cache.sqlite")
+        data = {"id": "msg1", "payload": {"headers": [{"name": "Subject", "value": "한글 제목"}]}}
+        
+        cache.put("msg1", "metadata", data)
+        
+        assert cache.get("msg1", "metadata") == data
+        assert cache.get("msg1", "full") is None
+        assert cache.get("msg2", "metadata") is None
+        cache.close()
+    
+    def test_persists_across_instances(self, tmp_path):
+        """다른 인스턴스에서도 캐시가 유지되는지 테스트"""
+        db_file = tmp_path / "msg_cache.sqlite"
+        cache = MessageCache(db_file)
+        cache.put_many([("msg1", {"id": "msg1"}), ("msg2", {"id": "msg2"})], "full")
+        cache.close()
+        
+        cache = MessageCache(db_file)
+        assert cache.get_many(["msg1", "msg2", "msg3"], "full") == {
+            "msg1": {"id": "msg1"},
+            "msg2": {"id": "msg2"},
+        }
+        cache.close()
+    
+    def test_ttl_expiry(self, tmp_path):
+        """유효 시간이 지난 캐시는 무시하는지 테스트"""
+        cache = MessageCache(tmp_path / "msg_cache.sqlite", ttl=60)
+        cache.put("msg1", "metadata", {"id": "msg1"})
+        
+        with patch("time.time", return_value=time.time() + 120):
+            assert cache.get("msg1", "metadata") is None
+        assert cache.get("msg1", "metadata") == {"id": "msg1"}
+        cache.close()
+    
+    def test_extractor_uses_cache(self, tmp_path):
+        """캐시된 메시지는 API를 호출하지 않는지 테스트"""
+        cache = MessageCache(tmp_path / "msg_cache.sqlite")
+        mock_service = Mock()
+        mock_service.users().messages().get().execute.return_value = {"payload": {}}
+        
+        extractor = EmailExtractor(mock_service, cache=cache)
+        extractor.get_email_data("msg1")
+        mock_service.users().messages().get().execute.reset_mock()
+        
+        email_data = extractor.get_email_data("msg1")
+        
+        assert email_data.message_id == "msg1"
+        mock_service.users().messages().get().execute.assert_not_called()
+        cache.close()
+    
+    def test_workflow_opens_cache_once_and_closes(self, temp_config):
+        """워크플로우가 캐시를 한 번만 열고 실행이 끝나면 닫는지 테스트"""
+        workflow = GmailTableExtractor(temp_config)
+        
+        with patch("gmail_crawler.core.workflow.GmailAuthenticator"):
+            workflow.authenticate()
+            cache = workflow.message_cache
+            workflow.authenticate()
+        
+        assert cache is not None
+        assert workflow.message_cache is cache
+        assert workflow.email_extractor.cache is cache
+        
+        workflow.close()
+        
+        assert workflow.message_cache is None
+        assert workflow.email_extractor.cache is None
+        with pytest.raises(sqlite3.ProgrammingError):
+            cache.get("msg1", "metadata")
@@ -1,12 +1,19 @@
 """
 모델 클래스 테스트
 """
-import tempfile
 import pytest
 from pathlib import Path
 
 from models import EmailData, TableData, ProcessingResult, FilePaths
 
+# 개별 테스트와 관계없는 EmailData 필수 필드
+_BASE_EMAIL_KWARGS = {"message_id": "1", "sender": "test", "subject": "test", "date": "2024-01-01"}
+
+
+def _make_email(**overrides) -> EmailData:
+    """기본 필드에 지정한 필드만 바꾼 EmailData를 만듭니다."""
+    return EmailData(**{**_BASE_EMAIL_KWARGS, **overrides})
+
 
 class TestEmailData:
     """EmailData 클래스 테스트"""
@@ -29,44 +36,29 @@ class TestEmailData:
         assert email.has_html is True
         assert email.has_tables is True
     
-    def test_has_tables_property(self):
+    @pytest.mark.parametrize("tables_html,expected", [
+        ("<table>테이블</table>", True),  # 테이블이 있는 경우
+        ("", False),  # 테이블이 없는 경우
+        (None, False),  # None인 경우
+    ])
+    def test_has_tables_property(self, tables_html, expected):
         """has_tables 속성 테스트"""
-        # 테이블이 있는 경우
-        email_with_tables = EmailData(
-            message_id="1", sender="test", subject="test", date="2024-01-01",
-            tables_html="<table>테이블</table>"
-        )
-        assert email_with_tables.has_tables is True
-        
-        # 테이블이 없는 경우
-        email_without_tables = EmailData(
-            message_id="1", sender="test", subject="test", date="2024-01-01",
-            tables_html=""
-        )
-        assert email_without_tables.has_tables is False
-        
-        # None인 경우
-        email_none_tables = EmailData(
-            message_id="1", sender="test", subject="test", date="2024-01-01",
-            tables_html=None
-        )
-        assert email_none_tables.has_tables is False
+        assert _make_email(tables_html=tables_html).has_tables is expected
     
-    def test_has_html_property(self):
+    @pytest.mark.parametrize("html_content,expected", [
+        ("<html>테스트</html>", True),  # HTML이 있는 경우
+        ("", False),  # HTML이 없는 경우
+        (None, False),  # None인 경우
+    ])
+    def test_has_html_property(self, html_content, expected):
         """has_html 속성 테스트"""
-        # HTML이 있는 경우
-        email_with_html = EmailData(
-            message_id="1", sender="test", subject="test", date="2024-01-01",
-            html_content="<html>테스트</html>"
-        )
-        assert email_with_html.has_html is True
-        
-        # HTML이 없는 경우
-        email_without_html = EmailData(
-            message_id="1", sender="test", subject="test", date="2024-01-01",
-            html_content=""
-        )
-        assert email_without_html.has_html is False
+        assert _make_email(html_content=html_content).has_html is expected
+    
+    def test_email_data_is_immutable(self):
+        """EmailData 불변성 테스트"""
+        email = _make_email()
+        with pytest.raises(AttributeError):
+            email.subject = "changed"
 
 
 class TestTableData:
@@ -114,7 +106,7 @@ class TestProcessingResult:
             success=True,
             message="성공",
             input_file=Path("input.html"),
-            output_files=[Path("output.xlsx")],
+            output_files=(Path("output.xlsx"),),
             processing_time=1.5
         )
         
@@ -139,7 +131,7 @@ class TestProcessingResult:
         assert result.message == "실패"
         assert result.error == error
         assert result.input_file is None
-        assert len(result.output_files) == 0
+        assert result.output_files == ()
 
 
 class TestFilePaths:
@@ -169,27 +161,28 @@ class TestFilePaths:
         )
         
         all_files = file_paths.get_all_files()
+        all_set = file_paths.get_all_files_set()
         
-        assert len(all_files) == 3
-        assert Path("test.html") in all_files
-        assert Path("test.png") in all_files
-        assert Path("test.xlsx") in all_files
-        assert None not in all_files
+        assert all_files == (Path("test.html"), Path("test.png"), Path("test.xlsx"))
+        assert all_set == frozenset(all_files)
+        assert Path("test.html") in all_set
+        assert Path("test.png") in all_set
+        assert Path("test.xlsx") in all_set
+        assert None not in all_set
     
-    def test_get_existing_files(self):
+    def test_get_existing_files(self, tmp_path):
         """존재하는 파일들만 반환 테스트"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            existing_file = Path(temp_dir) / "existing.txt"
-            existing_file.write_text("test")
-            
-            file_paths = FilePaths(
-                html_file=existing_file,
-                png_file=Path("nonexistent.png"),
-                json_file=None,
-                excel_file=Path("nonexistent.xlsx")
-            )
-            
-            existing_files = file_paths.get_existing_files()
-            
-            assert len(existing_files) == 1
-            assert existing_file in existing_files
+        existing_file = tmp_path / "existing.txt"
+        existing_file.write_text("test")
+        
+        file_paths = FilePaths(
+            html_file=existing_file,
+            png_file=Path("nonexistent.png"),
+            json_file=None,
+            excel_file=Path("nonexistent.xlsx")
+        )
+        
+        existing_files = file_paths.get_existing_files()
+        
+        assert len(existing_files) == 1
+        assert existing_file in existing_files
@@ -3,37 +3,122 @@
 """
 import pytest
 from unittest.mock import Mock, patch
-from read_body import EmailExtractor
+from googleapiclient.errors import HttpError
+from gmail_crawler.services import read_body
+from gmail_crawler.services.read_body import EmailExtractor, HeaderView
+from gmail_crawler.utils.exceptions import EmailNotFoundError
+from gmail_crawler.utils.utils import build_date_query
+
+
+def make_http_error(status):
+    """지정한 상태 코드의 HttpError를 만듭니다."""
+    return HttpError(Mock(status=status, reason="error"), b"{}")
+
+
+class FakeBatch:
+    """BatchHttpRequest 대역: 추가된 요청을 순서대로 실행하고 콜백을 호출합니다."""
+    
+    def __init__(self, callback):
+        self.callback = callback
+        self.requests = []
+    
+    def add(self, request, request_id=None):
+        self.requests.append((request_id, request))
+    
+    def execute(self, http=None):
+        for request_id, request in self.requests:
+            try:
+                response = request.execute()
+            except Exception as e:
+                self.callback(request_id, None, e)
+            else:
+                self.callback(request_id, response, None)
+
+
+def use_fake_batch(mock_service):
+    """Mock 서비스가 FakeBatch를 생성하도록 설정하고 생성된 배치 목록을 반환합니다."""
+    batches = []
+    
+    def new_batch_http_request(callback=None):
+        batch = FakeBatch(callback)
+        batches.append(batch)
+        return batch
+    
+    mock_service.new_batch_http_request.side_effect = new_batch_http_request
+    return batches
+
+
+# 발신자 검색 테스트에서 사용하는 메타데이터 응답
+METADATA_RESPONSE = {
+    "payload": {
+        "headers": [
+            {"name": "From", "value": "이도한 <sender@example.com>"},
+            {"name": "Subject", "value": "테스트 제목"},
+            {"name": "Date", "value": "2024-01-01"}
+        ]
+    }
+}
+
+
+def make_gmail_service(message_ids=(), get_response=METADATA_RESPONSE):
+    """
+    리소스 체인을 미리 연결하고 FakeBatch를 사용하는 Mock Gmail 서비스를 만듭니다.
+    
+    Args:
+        message_ids: messages().list() 응답에 담을 메시지 ID 목록
+        get_response: messages().get() 응답
+        
+    Returns:
+        (Mock 서비스, users().messages() Mock, 생성된 FakeBatch 목록)
+    """
+    messages = Mock()
+    messages.list.return_value.execute.return_value = {
+        "messages": [{"id": msg_id} for msg_id in message_ids]
+    }
+    messages.get.return_value.execute.return_value = get_response
+    users = Mock()
+    users.messages.return_value = messages
+    mock_service = Mock()
+    mock_service.users.return_value = users
+    batches = use_fake_batch(mock_service)
+    return mock_service, messages, batches
+
+
+@pytest.fixture(scope="module")
+def mock_gmail_service():
+    """발신자 검색 테스트에서 공유하는 Mock Gmail 서비스 (목록 응답은 테스트에서 지정)"""
+    return make_gmail_service()[0]
+
+
+@pytest.fixture(scope="module")
+def gmail_messages(mock_gmail_service):
+    """공유 Mock 서비스의 users().messages() 리소스"""
+    return mock_gmail_service.users().messages()
+
+
+@pytest.fixture(scope="module")
+def extractor(mock_gmail_service):
+    """공유 Mock 서비스를 사용하는 EmailExtractor"""
+    return EmailExtractor(mock_gmail_service)
+
+
+@pytest.fixture(scope="module")
+def offline_extractor():
+    """Gmail 서비스 없이 본문 처리만 하는 EmailExtractor"""
+    return EmailExtractor(None)
 
 
 class TestEmailExtractor:
     """EmailExtractor 클래스 테스트"""
     
-    def test_list_messages_from_sender_with_name(self):
+    def test_list_messages_from_sender_with_name(self, gmail_messages, extractor):
         """이름으로 메시지 검색 테스트"""
-        # Mock 서비스 생성
-        mock_service = Mock()
-        mock_response = {
+        gmail_messages.list.return_value.execute.return_value = {
             "messages": [
                 {"id": "msg1"},
                 {"id": "msg2"}
             ]
         }
-        mock_service.users().messages().list().execute.return_value = mock_response
-        
-        # Mock 메시지 메타데이터
-        mock_metadata = {
-            "payload": {
-                "headers": [
-                    {"name": "From", "value": "이도한 <sender@example.com>"},
-                    {"name": "Subject", "value": "테스트 제목"},
-                    {"name": "Date", "value": "2024-01-01"}
-                ]
-            }
-        }
-        mock_service.users().messages().get().execute.return_value = mock_metadata
-        
-        extractor = EmailExtractor(mock_service)
         
         # 이름으로 검색
         result = extractor.list_messages_from_sender("이도한", 10)
@@ -42,41 +127,212 @@ class TestEmailExtractor:
         assert result[0]["id"] == "msg1"
         assert result[1]["id"] == "msg2"
         assert result[0]["subject"] == "테스트 제목"
+        assert result[0]["parsed_date"] is None  # 제목에 날짜가 없음
     
-    def test_list_messages_from_sender_with_email(self):
+    def test_list_messages_from_sender_with_email(self, gmail_messages, extractor):
         """이메일 주소로 메시지 검색 테스트"""
-        # Mock 서비스 생성
-        mock_service = Mock()
-        mock_response = {
+        gmail_messages.list.return_value.execute.return_value = {
             "messages": [
                 {"id": "msg1"}
             ]
         }
-        mock_service.users().messages().list().execute.return_value = mock_response
         
-        # Mock 메시지 메타데이터
-        mock_metadata = {
+        # 이메일 주소로 검색
+        result = extractor.list_messages_from_sender("sender@example.com", 10)
+        
+        assert len(result) == 1
+        assert result[0]["id"] == "msg1"
+        assert result[0]["subject"] == "테스트 제목"
+    
+    def test_list_messages_from_sender_email_ignores_case(self):
+        """이메일 주소 검색 시 대소문자를 무시하는지 테스트"""
+        mock_service, _, _ = make_gmail_service(
+            ["msg1"],
+            {"payload": {"headers": [{"name": "From", "value": "이도한 <Sender@Example.COM>"}]}},
+        )
+        
+        extractor = EmailExtractor(mock_service)
+        result = extractor.list_messages_from_sender("sender@example.com", 10)
+        
+        assert [r["id"] for r in result] == ["msg1"]
+    
+    def test_list_messages_from_sender_batches_requests(self):
+        """메타데이터 조회를 100개 단위 배치로 묶는지 테스트"""
+        mock_service, _, batches = make_gmail_service([f"msg{i}" for i in range(150)])
+        
+        extractor = EmailExtractor(mock_service)
+        result = extractor.list_messages_from_sender("이도한", 150)
+        
+        assert [len(b.requests) for b in batches] == [100, 50]
+        assert [r["id"] for r in result] == [f"msg{i}" for i in range(150)]
+    
+    def test_list_messages_from_sender_uses_single_batch(self):
+        """메타데이터를 개별 요청 없이 배치 한 번으로 조회하는지 테스트"""
+        mock_service, messages, batches = make_gmail_service(["msg1", "msg2", "msg3"])
+        
+        extractor = EmailExtractor(mock_service)
+        result = extractor.list_messages_from_sender("이도한", 10)
+        
+        assert [len(b.requests) for b in batches] == [3]
+        assert [request_id for request_id, _ in batches[0].requests] == ["msg1", "msg2", "msg3"]
+        assert len(result) == 3
+        # 배치 안에서만 실행되고 개별 재시도 요청(http, num_retries 지정)은 없어야 함
+        for call in messages.get.return_value.execute.call_args_list:
+            assert call.kwargs == {}
+    
+    def test_metadata_request_filters_headers(self):
+        """메타데이터 조회 시 필요한 헤더만 요청하는지 테스트"""
+        mock_service, messages, _ = make_gmail_service(["msg1"])
+        
+        extractor = EmailExtractor(mock_service)
+        extractor.list_messages_from_sender("이도한", 10)
+        
+        messages.get.assert_called_with(
+            userId="me", id="msg1", format="metadata", metadataHeaders=["From", "Subject", "Date"]
+        )
+    
+    def test_header_view(self):
+        """헤더 이름을 대소문자 구분 없이 처음 조회할 때 색인하는지 테스트"""
+        headers = HeaderView([
+            {"name": "From", "value": "이도한 <sender@example.com>"},
+            {"name": "subject", "value": "테스트 제목"},
+        ])
+        
+        assert headers._index is None
+        assert headers["from"] == "이도한 <sender@example.com>"
+        assert headers["Subject"] == "테스트 제목"
+        assert headers["Date"] == ""
+        assert headers.get("Date", None) is None
+    
+    def test_get_email_data_batch(self):
+        """여러 메시지 데이터 배치 추출 테스트"""
+        mock_service, _, batches = make_gmail_service(get_response={
             "payload": {
-                "headers": [
-                    {"name": "From", "value": "이도한 <sender@example.com>"},
-                    {"name": "Subject", "value": "테스트 제목"},
-                    {"name": "Date", "value": "2024-01-01"}
-                ]
+                "mimeType": "text/html",
+                "body": {"data": "PHRhYmxlPjwvdGFibGU-"},  # <table></table>
+                "headers": [{"name": "Subject", "value": "테스트 제목"}],
             }
+        })
+        
+        extractor = EmailExtractor(mock_service)
+        result = extractor.get_email_data_batch(["msg1", "msg2"])
+        
+        assert len(batches) == 2
+        assert [e.message_id for e in result] == ["msg1", "msg2"]
+        assert result[0].subject == "테스트 제목"
+        assert result[0].has_tables is True
+    
+    def test_get_email_data_batch_error(self):
+        """배치 하위 요청 실패 시 예외 테스트"""
+        from gmail_crawler.utils.exceptions import EmailExtractionError
+        
+        mock_service, messages, _ = make_gmail_service()
+        messages.get.return_value.execute.side_effect = RuntimeError("404")
+        
+        extractor = EmailExtractor(mock_service)
+        with pytest.raises(EmailExtractionError):
+            extractor.get_email_data_batch(["msg1"])
+    
+    def test_batch_failure_falls_back_to_individual_requests(self):
+        """배치 요청 자체가 실패하면 개별 요청으로 처리하는지 테스트"""
+        mock_service, messages, _ = make_gmail_service()
+        batch = Mock()
+        batch.execute.side_effect = make_http_error(503)
+        mock_service.new_batch_http_request = Mock(return_value=batch)
+        
+        extractor = EmailExtractor(mock_service)
+        result = extractor._batch_get(
+            (msg_id, extractor._metadata_request(msg_id)) for msg_id in ["msg1", "msg2"]
+        )
+        
+        assert set(result) == {"msg1", "msg2"}
+        messages.get.return_value.execute.assert_called_with(http=None, num_retries=3)
+    
+    def test_batch_retries_rate_limited_subrequests(self):
+        """429로 실패한 하위 요청만 개별 요청으로 재시도하는지 테스트"""
+        ok_request = Mock()
+        ok_request.execute.return_value = {"id": "msg1"}
+        limited_request = Mock()
+        limited_request.execute.side_effect = [make_http_error(429), {"id": "msg2"}]
+        
+        mock_service, _, _ = make_gmail_service()
+        
+        extractor = EmailExtractor(mock_service)
+        result = extractor._batch_get([("msg1", ok_request), ("msg2", limited_request)])
+        
+        assert result == {"msg1": {"id": "msg1"}, "msg2": {"id": "msg2"}}
+        assert ok_request.execute.call_count == 1
+        assert limited_request.execute.call_count == 2
+    
+    def test_list_messages_from_sender_with_extra_query(self):
+        """날짜 범위 검색 조건을 목록 조회 쿼리에 덧붙이는지 테스트"""
+        mock_service, messages, _ = make_gmail_service()
+        date_query = build_date_query("20250904")
+        
+        extractor = EmailExtractor(mock_service)
+        
+        with pytest.raises(EmailNotFoundError):
+            extractor.list_messages_from_sender("sender@example.com", 5, extra_query=date_query)
+        
+        assert date_query == "after:2025/09/01 before:2025/09/08"
+        messages.list.assert_called_with(
+            userId="me",
+            q="from:sender@example.com after:2025/09/01 before:2025/09/08",
+            maxResults=5,
+        )
+    
+    def test_decode_part(self, offline_extractor):
+        """base64url 디코딩 테스트"""
+        assert offline_extractor.decode_part("PHA-7YWM7Iqk7Yq4PC9wPg==") == "<p>테스트</p>"
+        assert offline_extractor.decode_part("") == ""
+    
+    def test_get_email_data_fetches_html_attachment(self):
+        """HTML 본문이 첨부파일로만 제공될 때 첨부파일을 조회하는지 테스트"""
+        mock_service, messages, _ = make_gmail_service(get_response={
+            "payload": {
+                "mimeType": "multipart/mixed",
+                "parts": [
+                    {"mimeType": "image/png", "body": {"attachmentId": "img"}},
+                    {"mimeType": "text/html", "body": {"attachmentId": "att1"}},
+                ],
+            }
+        })
+        attachments = messages.attachments.return_value
+        attachments.get.return_value.execute.return_value = {
+            "data": "PHRhYmxlPjwvdGFibGU-"  # <table></table>
         }
-        mock_service.users().messages().get().execute.return_value = mock_metadata
         
         extractor = EmailExtractor(mock_service)
+        email_data = extractor.get_email_data("msg1")
         
-        # 이메일 주소로 검색
-        result = extractor.list_messages_from_sender("sender@example.com", 10)
+        assert email_data.html_content == "<table></table>"
+        attachments.get.assert_called_with(
+            userId="me", messageId="msg1", id="att1"
+        )
+    
+    def test_get_email_data_walks_payload_once(self):
+        """HTML, 텍스트, 테이블을 페이로드 한 번 순회로 추출하는지 테스트"""
+        mock_service, _, _ = make_gmail_service(get_response={
+            "payload": {
+                "mimeType": "multipart/alternative",
+                "parts": [
+                    {"mimeType": "text/plain", "body": {"data": "7YWM7Iqk7Yq4"}},  # 테스트
+                    {"mimeType": "text/html", "body": {"data": "PHRhYmxlPjwvdGFibGU-"}},  # <table></table>
+                ],
+            }
+        })
         
-        assert len(result) == 1
-        assert result[0]["id"] == "msg1"
-        assert result[0]["subject"] == "테스트 제목"
+        extractor = EmailExtractor(mock_service)
+        with patch.object(read_body, "_walk_payload", wraps=read_body._walk_payload) as walk:
+            email_data = extractor.get_email_data("msg1")
+        
+        assert walk.call_count == 1
+        assert email_data.html_content == "<table></table>"
+        assert email_data.text_content == "테스트\n<table></table>"
+        assert email_data.tables_html == "<table></table>"
     
-    def test_extract_tables_only_with_beautifulsoup(self):
-        """BeautifulSoup를 사용한 테이블 추출 테스트"""
+    def test_extract_tables_only(self, offline_extractor):
+        """테이블 추출 테스트"""
         html = """
         <html>
         <body>
@@ -90,26 +346,85 @@ class TestEmailExtractor:
         </html>
         """
         
-        extractor = EmailExtractor(None)
-        result = extractor.extract_tables_only(html)
+        result = offline_extractor.extract_tables_only(html)
         
         assert "<table>" in result
         assert "<tr><th>열1</th><th>열2</th></tr>" in result
         assert "<tr><td>값1</td><td>값2</td></tr>" in result
         assert "<p>일반 텍스트</p>" not in result
     
-    def test_extract_tables_only_empty_html(self):
+    def test_extract_tables_only_regex_fallback(self, offline_extractor):
+        """lxml이 없으면 중첩 테이블도 정규식 결과를 그대로 사용하는지 테스트"""
+        html = "<p>앞</p><TABLE border=1><tr><td><table><tr><td>안쪽</td></tr></table></td></tr></Table>"
+        
+        with patch.object(read_body, "lxml_html", None):
+            result = offline_extractor.extract_tables_only(html)
+        
+        # 정규식은 첫 번째 </table>에서 끝나므로 바깥 테이블이 잘린 채로 반환됨
+        assert result == "<TABLE border=1><tr><td><table><tr><td>안쪽</td></tr></table>"
+    
+    @pytest.mark.parametrize("html", [
+        "<!--[if mso]><table><tr><td>mso</td></tr></table><![endif]-->"
+        "<table><tr><td>값</td></tr></table>",
+        "<!-- <table><tr><td>주석</td></tr></table> --><table><tr><td>값</td></tr></table>",
+        "<script>var t = '<table><tr><td>스크립트</td></tr></table>';</script>"
+        "<table><tr><td>값</td></tr></table>",
+    ])
+    def test_extract_tables_only_ignores_comments_and_scripts(self, offline_extractor, html):
+        """주석(Outlook 조건부 주석 포함)과 script 안의 테이블은 추출하지 않는지 테스트"""
+        result = offline_extractor.extract_tables_only(html)
+        
+        assert result == "<table><tr><td>값</td></tr></table>"
+    
+    def test_extract_tables_only_style_head_uses_regex(self, offline_extractor):
+        """<style>이 있는 일반적인 이메일도 lxml 없이 정규식으로 처리하는지 테스트"""
+        html = (
+            "<html><head><style>table { border: 1px solid; }</style></head>"
+            "<body><table><tr><td>값</td></tr></table></body></html>"
+        )
+        
+        with patch.object(read_body.lxml_html, "fromstring") as fromstring:
+            result = offline_extractor.extract_tables_only(html)
+        
+        fromstring.assert_not_called()
+        assert result == "<table><tr><td>값</td></tr></table>"
+    
+    def test_extract_tables_only_xml_declaration(self, offline_extractor):
+        """XML 선언으로 시작하는 문서에서도 중첩 테이블을 추출하는지 테스트"""
+        html = (
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            "<html><body><table><tr><td><table><tr><td>안쪽</td></tr></table></td></tr></table>"
+            "</body></html>"
+        )
+        
+        result = offline_extractor.extract_tables_only(html)
+        
+        assert result.split("\n") == [
+            "<table><tr><td><table><tr><td>안쪽</td></tr></table></td></tr></table>",
+            "<table><tr><td>안쪽</td></tr></table>",
+        ]
+    
+    def test_extract_tables_only_empty_html(self, offline_extractor):
         """빈 HTML에서 테이블 추출 테스트"""
-        extractor = EmailExtractor(None)
-        result = extractor.extract_tables_only("")
+        result = offline_extractor.extract_tables_only("")
         
         assert result == ""
     
-    def test_extract_tables_only_no_tables(self):
+    def test_extract_tables_only_no_tables(self, offline_extractor):
         """테이블이 없는 HTML에서 추출 테스트"""
         html = "<html><body><p>테이블 없음</p></body></html>"
         
-        extractor = EmailExtractor(None)
-        result = extractor.extract_tables_only(html)
+        result = offline_extractor.extract_tables_only(html)
         
         assert result == ""
+    
+    def test_extract_tables_only_nested_tables(self, offline_extractor):
+        """중첩된 테이블은 lxml로 추출하는지 테스트"""
+        html = "<p>앞</p><table><tr><td><table><tr><td>안쪽</td></tr></table></td></tr></table>"
+        
+        result = offline_extractor.extract_tables_only(html)
+        
+        assert result.split("\n") == [
+            "<table><tr><td><table><tr><td>안쪽</td></tr></table></td></tr></table>",
+            "<table><tr><td>안쪽</td></tr></table>",
+        ]
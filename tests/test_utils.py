@@ -1,38 +1,46 @@
 """
 유틸리티 모듈 테스트
 """
-import tempfile
-from pathlib import Path
+import asyncio
+from datetime import datetime
+from unittest.mock import patch
 import pytest
 
 from utils import (
     save_html_file,
+    save_html_file_async,
     create_table_html,
     create_full_html,
     save_json_file,
+    save_json_file_async,
     load_json_file,
     generate_timestamp,
     clean_filename,
-    ensure_directory_exists
+    ensure_directory_exists,
+    parse_date_from_subject,
+    _match_subject_date,
+    build_date_index,
+    find_message_by_date,
+    find_latest_message,
+    build_date_query
 )
-from exceptions import FileProcessingError
+from exceptions import FileProcessingError, ValidationError
 
 
 class TestUtils:
     """유틸리티 함수 테스트"""
     
-    def test_save_html_file(self):
+    def test_save_html_file(self, tmp_path):
         """HTML 파일 저장 테스트"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_dir = Path(temp_dir)
-            content = "<html><body>테스트</body></html>"
-            filename = "test.html"
-            
-            result_path = save_html_file(content, filename, output_dir)
-            
-            assert result_path.exists()
-            assert result_path.name == filename
-            assert result_path.read_text(encoding="utf-8") == content
+        output_dir = tmp_path
+        content = "<html><body>테스트</body></html>"
+        filename = "test.html"
+        
+        result_path = save_html_file(content, filename, output_dir)
+        
+        assert result_path.exists()
+        assert result_path.name == filename
+        assert result_path.read_text(encoding="utf-8") == content
     
     def test_create_table_html(self):
         """테이블 HTML 생성 테스트"""
@@ -55,16 +63,41 @@ class TestUtils:
         assert "<meta charset='utf-8'>" in result
         assert content in result
     
-    def test_save_and_load_json_file(self):
+    def test_save_and_load_json_file(self, tmp_path):
         """JSON 파일 저장 및 로드 테스트"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            file_path = Path(temp_dir) / "test.json"
-            test_data = {"test": "data", "number": 123}
-            
-            save_json_file(test_data, file_path)
-            loaded_data = load_json_file(file_path)
-            
-            assert loaded_data == test_data
+        file_path = tmp_path / "test.json"
+        test_data = {"test": "data", "number": 123}
+        
+        save_json_file(test_data, file_path)
+        loaded_data = load_json_file(file_path)
+        
+        assert loaded_data == test_data
+    
+    def test_save_json_file_writes_utf8(self, tmp_path):
+        """한글을 이스케이프하지 않고 UTF-8로 저장하는지 테스트"""
+        file_path = tmp_path / "test.json"
+        
+        save_json_file({"품목": "두부", 1: "값"}, file_path)
+        
+        raw = file_path.read_bytes()
+        assert "두부".encode("utf-8") in raw
+        assert b"\\u" not in raw
+        assert load_json_file(file_path) == {"품목": "두부", "1": "값"}
+    
+    def test_save_files_async(self, tmp_path):
+        """비동기 파일 저장 테스트"""
+        async def save_all(temp_dir):
+            return await asyncio.gather(
+                save_html_file_async("<html>1</html>", "a.html", temp_dir),
+                save_html_file_async("<html>2</html>", "b.html", temp_dir),
+                save_json_file_async({"key": "값"}, temp_dir / "c.json"),
+            )
+        
+        html_a, html_b, _ = asyncio.run(save_all(tmp_path))
+        
+        assert html_a.read_text(encoding="utf-8") == "<html>1</html>"
+        assert html_b.read_text(encoding="utf-8") == "<html>2</html>"
+        assert load_json_file(tmp_path / "c.json") == {"key": "값"}
     
     def test_generate_timestamp(self):
         """타임스탬프 생성 테스트"""
@@ -81,90 +114,122 @@ class TestUtils:
         unsafe_filename = "test<>:\"/\\|?*file.txt"
         cleaned = clean_filename(unsafe_filename)
         
-        assert "<" not in cleaned
-        assert ">" not in cleaned
-        assert ":" not in cleaned
-        assert '"' not in cleaned
-        assert "/" not in cleaned
-        assert "\\" not in cleaned
-        assert "|" not in cleaned
-        assert "?" not in cleaned
-        assert "*" not in cleaned
+        assert not set(cleaned) & set('<>:"/\\|?*')
         assert "file.txt" in cleaned
     
-    def test_ensure_directory_exists(self):
+    def test_ensure_directory_exists(self, tmp_path):
         """디렉토리 생성 테스트"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            new_dir = Path(temp_dir) / "new_directory"
-            
-            ensure_directory_exists(new_dir)
-            
-            assert new_dir.exists()
-            assert new_dir.is_dir()
-    
-    def test_save_html_file_error(self):
+        new_dir = tmp_path / "new_directory"
+        
+        ensure_directory_exists(new_dir)
+        
+        assert new_dir.exists()
+        assert new_dir.is_dir()
+    
+    def test_save_html_file_error(self, tmp_path):
         """HTML 파일 저장 오류 테스트"""
         # 읽기 전용 디렉토리에 저장 시도
-        with tempfile.TemporaryDirectory() as temp_dir:
-            readonly_dir = Path(temp_dir) / "readonly"
-            readonly_dir.mkdir()
-            readonly_dir.chmod(0o444)  # 읽기 전용
-            
-            try:
-                with pytest.raises(FileProcessingError):
-                    save_html_file("test", "test.html", readonly_dir)
-            finally:
-                # 권한 복원
-                readonly_dir.chmod(0o755)
-    
-    def test_parse_date_from_subject(self):
-        """제목에서 날짜 추출 테스트"""
-        from utils import parse_date_from_subject
+        readonly_dir = tmp_path / "readonly"
+        readonly_dir.mkdir()
+        readonly_dir.chmod(0o444)  # 읽기 전용
         
+        try:
+            with pytest.raises(FileProcessingError):
+                save_html_file("test", "test.html", readonly_dir)
+        finally:
+            # 권한 복원
+            readonly_dir.chmod(0o755)
+    
+    @pytest.mark.parametrize("subject,expected", [
         # 패턴 1: "2025년09월04일" 형식
-        subject1 = "(조이푸드)금일2편/익일1편 2025년09월04일(2편) ~ 09월05일(1편)"
-        result1 = parse_date_from_subject(subject1)
-        assert result1 == "20250904"
-        
+        ("(조이푸드)금일2편/익일1편 2025년09월04일(2편) ~ 09월05일(1편)", "20250904"),
         # 패턴 2: "20250902" 형식
-        subject2 = "삼립_푸드코아 확정주문 및 센터 별 픽업수량 안내 / SO 납품일 : 20250902"
-        result2 = parse_date_from_subject(subject2)
-        assert result2 == "20250902"
+        ("삼립_푸드코아 확정주문 및 센터 별 픽업수량 안내 / SO 납품일 : 20250902", "20250902"),
+        # 날짜가 없는 제목
+        ("일반 제목입니다", None),
+    ])
+    def test_parse_date_from_subject(self, subject, expected):
+        """제목에서 날짜 추출 테스트"""
+        assert parse_date_from_subject(subject) == expected
+    
+    def test_parse_date_from_subject_current_year(self):
+        """월일만 있는 제목은 올해 날짜로 추출하는지 테스트"""
+        assert parse_date_from_subject("일반 제목 09월04일 테스트") == f"{datetime.now().year}0904"
+    
+    @pytest.mark.parametrize("subject,expected", [
+        # "YYYY년MM월DD일"이 8자리 숫자보다 우선
+        ("납품일 20250902 / 2025년09월04일", "20250904"),
+        # 8자리 숫자가 "MM월DD일"보다 우선
+        ("09월04일 발주 / SO 20250902", "20250902"),
+        # 유효하지 않은 8자리 숫자는 건너뛰고 "MM월DD일" 사용
+        ("주문번호 12345678 09월04일", f"{datetime.now().year}0904"),
+    ])
+    def test_parse_date_from_subject_priority(self, subject, expected):
+        """날짜 패턴 우선순위 테스트"""
+        assert parse_date_from_subject(subject) == expected
+    
+    def test_parse_date_from_subject_is_cached(self):
+        """같은 제목은 캐시된 결과를 사용하는지 테스트"""
+        subject = "캐시 테스트 2025년09월04일"
+        parse_date_from_subject(subject)
+        hits = _match_subject_date.cache_info().hits
         
-        # 패턴 3: "09월04일" 형식 (올해 기준)
-        subject3 = "일반 제목 09월04일 테스트"
-        result3 = parse_date_from_subject(subject3)
-        assert result3 is not None
-        assert len(result3) == 8  # YYYYMMDD 형식
+        assert parse_date_from_subject(subject) == "20250904"
+        assert _match_subject_date.cache_info().hits == hits + 1
+    
+    def test_parse_date_from_subject_year_not_cached(self):
+        """캐시된 "MM월DD일" 제목도 호출 시점의 연도를 사용하는지 테스트"""
+        subject = "연도 테스트 09월04일"
         
-        # 날짜가 없는 제목
-        subject4 = "일반 제목입니다"
-        result4 = parse_date_from_subject(subject4)
-        assert result4 is None
+        with patch(f"{parse_date_from_subject.__module__}.datetime") as mock_datetime:
+            mock_datetime.now.return_value = datetime(2025, 12, 31)
+            assert parse_date_from_subject(subject) == "20250904"
+            mock_datetime.now.return_value = datetime(2026, 1, 1)
+            assert parse_date_from_subject(subject) == "20260904"
     
-    def test_find_message_by_date(self):
+    @pytest.mark.parametrize("target_date,expected_id", [
+        ("20250904", "msg1"),  # 특정 날짜 찾기
+        ("20250910", None),  # 없는 날짜 찾기
+    ])
+    def test_find_message_by_date(self, target_date, expected_id):
         """특정 날짜 메시지 찾기 테스트"""
-        from utils import find_message_by_date
+        messages_data = [
+            {"id": "msg1", "subject": "2025년09월04일 테스트", "date": "2025-09-04", "parsed_date": "20250904"},
+            {"id": "msg2", "subject": "2025년09월05일 테스트", "date": "2025-09-05", "parsed_date": "20250905"},
+            {"id": "msg3", "subject": "일반 제목", "date": "2025-09-06", "parsed_date": None}
+        ]
         
+        result = find_message_by_date(messages_data, target_date)
+        assert (result["id"] if result else None) == expected_id
+    
+    def test_find_message_by_date_uses_parsed_date(self):
+        """미리 추출한 parsed_date가 있으면 제목을 다시 파싱하지 않는지 테스트"""
         messages_data = [
-            {"id": "msg1", "subject": "2025년09월04일 테스트", "date": "2025-09-04"},
-            {"id": "msg2", "subject": "2025년09월05일 테스트", "date": "2025-09-05"},
-            {"id": "msg3", "subject": "일반 제목", "date": "2025-09-06"}
+            {"id": "msg1", "subject": "2025년09월04일 테스트", "parsed_date": "20250905"},
+            {"id": "msg2", "subject": "2025년09월04일 테스트"},
         ]
         
-        # 특정 날짜 찾기
-        result = find_message_by_date(messages_data, "20250904")
-        assert result is not None
-        assert result["id"] == "msg1"
+        # parsed_date가 제목보다 우선하고, 없는 메시지는 제목에서 추출
+        assert find_message_by_date(messages_data, "20250905")["id"] == "msg1"
+        assert find_message_by_date(messages_data, "20250904")["id"] == "msg2"
+    
+    def test_build_date_index(self):
+        """제목 날짜별 색인 생성 및 색인 검색 테스트"""
+        messages_data = [
+            {"id": "msg1", "subject": "2025년09월04일 1차", "date": "2025-09-04"},
+            {"id": "msg2", "subject": "일반 제목", "date": "2025-09-05"},
+            {"id": "msg3", "subject": "2025년09월04일 2차", "date": "2025-09-06"},
+        ]
         
-        # 없는 날짜 찾기
-        result = find_message_by_date(messages_data, "20250910")
-        assert result is None
+        date_index = build_date_index(messages_data)
+        
+        # 같은 날짜면 목록에서 먼저 나온 메시지 (find_message_by_date와 동일)
+        assert date_index == {"20250904": messages_data[0]}
+        assert find_message_by_date(messages_data, "20250904", date_index)["id"] == "msg1"
+        assert find_message_by_date(messages_data, "20250910", date_index) is None
     
     def test_find_latest_message(self):
         """최신 메시지 찾기 테스트"""
-        from utils import find_latest_message
-        
         messages_data = [
             {"id": "msg1", "subject": "2025년09월04일 테스트", "date": "2025-09-04"},
             {"id": "msg2", "subject": "2025년09월06일 테스트", "date": "2025-09-06"},
@@ -179,3 +244,21 @@ class TestUtils:
         # 빈 목록
         result = find_latest_message([])
         assert result is None
+    
+    def test_find_latest_message_tie_break(self):
+        """제목 날짜가 같으면 먼저 나온 메시지를, 날짜 없는 제목은 가장 오래된 것으로 취급하는지 테스트"""
+        messages_data = [
+            {"id": "msg1", "subject": "일반 제목", "date": "2025-09-07"},
+            {"id": "msg2", "subject": "2025년09월06일 1차", "date": "2025-09-05"},
+            {"id": "msg3", "subject": "2025년09월06일 2차", "date": "2025-09-06"},
+        ]
+        
+        assert find_latest_message(messages_data)["id"] == "msg2"
+    
+    def test_build_date_query(self):
+        """날짜 범위 검색 조건 생성 테스트"""
+        assert build_date_query("20250904") == "after:2025/09/01 before:2025/09/08"
+        assert build_date_query("20250101", window_days=0) == "after:2025/01/01 before:2025/01/02"
+        
+        with pytest.raises(ValidationError):
+            build_date_query("2025-09-04")